@@ -1,10 +1,6 @@
 """getAir SmartControl integration for Home Assistant."""
 import logging
-from typing import Final
-
-from homeassistant.config_entries import ConfigEntry
-"""getAir SmartControl integration for Home Assistant."""
-import logging
+import time
 from typing import Final
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,57 +14,65 @@ from .const import (
     DOMAIN,
     CONF_AUTH_URL,
     CONF_API_URL,
-    CLIENT_ID,
+    get_client_id,
     CONF_DEVICE_ID,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_BANNER: Final = "=" * 80
+
+# Separators stripped from the configured MAC address in one translate() pass
+_MAC_STRIP: Final = str.maketrans("", "", ":-. ")
+
 PLATFORMS: Final = [Platform.BINARY_SENSOR, Platform.BUTTON, Platform.FAN, Platform.SENSOR, Platform.SELECT, Platform.SWITCH, Platform.NUMBER, Platform.DATETIME]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up getAir SmartControl from a config entry."""
 
-    _LOGGER.info("=" * 80)
-    _LOGGER.info("Setting up getAir SmartControl integration")
-    _LOGGER.info("Entry ID: %s", entry.entry_id)
-    _LOGGER.info("Entry Title: %s", entry.title)
-    _LOGGER.info("=" * 80)
-
-    # Log configuration (without sensitive data)
-    _LOGGER.debug(
-        "Configuration: auth_url=%s, api_url=%s, username=%s, device_id=%s",
-        entry.data.get(CONF_AUTH_URL),
-        entry.data.get(CONF_API_URL),
-        entry.data.get(CONF_USERNAME),
-        entry.data.get(CONF_DEVICE_ID),
-    )
+    setup_started = time.monotonic()
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+    if debug_enabled:
+        _LOGGER.debug(_BANNER)
+        _LOGGER.debug(
+            "Setting up getAir SmartControl integration (entry %s: %s)",
+            entry.entry_id,
+            entry.title,
+        )
+        _LOGGER.debug(_BANNER)
+
+        # Log configuration (without sensitive data)
+        _LOGGER.debug(
+            "Configuration: auth_url=%s, api_url=%s, username=%s, device_id=%s",
+            entry.data.get(CONF_AUTH_URL),
+            entry.data.get(CONF_API_URL),
+            entry.data.get(CONF_USERNAME),
+            entry.data.get(CONF_DEVICE_ID),
+        )
 
     # Initialize API client
     credentials_data = {
         CONF_AUTH_URL: entry.data[CONF_AUTH_URL],
         CONF_API_URL: entry.data[CONF_API_URL],
-        "client_id": CLIENT_ID,
+        "client_id": get_client_id(),
         CONF_USERNAME: entry.data[CONF_USERNAME],
         CONF_PASSWORD: entry.data[CONF_PASSWORD],
     }
 
     try:
-        _LOGGER.info("Step 1/4: Creating API client")
+        _LOGGER.debug("Step 1/4: Creating API client")
         api_client = GetAirAPIClient(credentials_data, hass.config.path())
-        _LOGGER.info("API client created successfully")
 
         # Connect to API
-        _LOGGER.info("Step 2/4: Connecting to API")
-        connect_result = await hass.async_add_executor_job(api_client.connect)
+        _LOGGER.debug("Step 2/4: Connecting to API")
+        connect_result = await api_client.async_connect(hass)
 
         if not connect_result:
             _LOGGER.error("API connection failed")
             raise ConfigEntryNotReady("Could not connect to getAir API")
 
-        _LOGGER.info("Successfully connected to getAir API")
-
     except ConfigEntryNotReady:
         raise
     except Exception as err:
@@ -76,8 +80,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(f"Error connecting to API: {err}")
 
     # Get device ID
-    device_id = entry.data[CONF_DEVICE_ID].upper().replace(":", "")
-    _LOGGER.info("Device ID (normalized): %s", device_id)
+    device_id = entry.data[CONF_DEVICE_ID].translate(_MAC_STRIP).upper()
+    _LOGGER.debug("Device ID (normalized): %s", device_id)
 
     # Get options with defaults
     polling_interval = entry.options.get("polling_interval", 60)
@@ -94,37 +98,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Create coordinator
-    _LOGGER.info("Step 3/4: Creating coordinator")
+    _LOGGER.debug("Step 3/4: Creating coordinator")
     coordinator = GetAirCoordinator(
         hass,
         api_client,
         device_id,
         polling_interval=polling_interval,
     )
-    _LOGGER.info("Coordinator created successfully")
 
     # Fetch initial data
-    _LOGGER.info("Step 4/4: Fetching initial data")
+    _LOGGER.debug("Step 4/4: Fetching initial data")
     try:
         await coordinator.async_config_entry_first_refresh()
-        _LOGGER.info("Initial data fetch completed successfully")
 
         # Log fetched data summary
-        if coordinator.data:
-            _LOGGER.debug("Initial data summary:")
-            if "system" in coordinator.data:
-                _LOGGER.debug("  System ID: %s", coordinator.data["system"].get("system_id"))
-                _LOGGER.debug("  System Type: %s", coordinator.data["system"].get("system_type"))
-                _LOGGER.debug("  FW Version: %s", coordinator.data["system"].get("fw_version"))
-            if "zones" in coordinator.data:
-                _LOGGER.debug("  Zones found: %d", len(coordinator.data["zones"]))
-                for zone_idx, zone_data in coordinator.data["zones"].items():
-                    _LOGGER.debug("    Zone %d: %s", zone_idx, zone_data.get("name"))
-        else:
+        if not coordinator.data:
             _LOGGER.warning("Initial data is empty or None")
+        elif debug_enabled:
+            system_data = coordinator.data.get("system", {})
+            _LOGGER.debug(
+                "Initial data summary: system_id=%s, system_type=%s, fw_version=%s, zones=%s",
+                system_data.get("system_id"),
+                system_data.get("system_type"),
+                system_data.get("fw_version"),
+                {
+                    zone_idx: zone_data.get("name")
+                    for zone_idx, zone_data in coordinator.data.get("zones", {}).items()
+                },
+            )
 
     except Exception as refresh_err:
         _LOGGER.exception("Failed to fetch initial data: %s", str(refresh_err))
+        await coordinator.async_shutdown()
         raise ConfigEntryNotReady(f"Failed to fetch initial data: {refresh_err}")
 
     # Store coordinator and device info
@@ -137,21 +142,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "zone_2": enable_zone_2,
             "zone_3": enable_zone_3,
         },
+        # Same information as zone indexes, resolved once for all platforms
+        "enabled_zone_idx": frozenset(
+            zone_idx
+            for zone_idx, enabled in ((1, enable_zone_1), (2, enable_zone_2), (3, enable_zone_3))
+            if enabled
+        ),
     }
 
-    _LOGGER.debug("Stored coordinator and device info in hass.data")
-
     # Forward entry setup
-    _LOGGER.info("Setting up platforms: %s", PLATFORMS)
+    _LOGGER.debug("Setting up platforms: %s", PLATFORMS)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    _LOGGER.info("Platforms setup completed")
 
     # Listen for option updates
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-    _LOGGER.info("=" * 80)
-    _LOGGER.info("getAir SmartControl setup completed successfully")
-    _LOGGER.info("=" * 80)
+    _LOGGER.info(
+        "getAir SmartControl setup completed for device %s in %.2fs",
+        device_id,
+        time.monotonic() - setup_started,
+    )
 
     return True
 
@@ -170,6 +180,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry_data = hass.data[DOMAIN].pop(entry.entry_id)
         api_client = entry_data.get("api_client")
 
+        # Stop polling and release the coordinator's executor threads
+        await entry_data["coordinator"].async_shutdown()
+
         if api_client:
             await hass.async_add_executor_job(_cleanup_credentials, api_client)
 
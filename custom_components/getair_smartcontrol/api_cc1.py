@@ -69,9 +69,22 @@ class API:
         self._devices = []
         self._reconnect_in_progress = False
 
+        # Keep-alive connection pool shared by all requests of this API
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4),
+        )
+
         self._logger = logging.getLogger("CC-API").getChild("API")
         self.set_logging_level(logging.INFO)
 
+    def close(self:API) -> None:
+        """
+        Closes the pooled HTTP connections.
+        """
+        self._session.close()
+
     def set_logging_level(self:API, level:int=logging.INFO) -> None:
         """
         Sets the logging level.
@@ -122,8 +135,8 @@ class API:
             }
 
         try:
-            response = requests.post(f"{self._auth_url}",
-                                     data=json.dumps(payload), headers=headers)
+            response = self._session.post(f"{self._auth_url}",
+                                          data=json.dumps(payload), headers=headers)
             if response.status_code == ResponseCode.OK:
                 response_data = response.json()
                 if response_data.get("refresh_token"):
@@ -162,8 +175,8 @@ class API:
         }
 
         try:
-            response = requests.post(f"{self._auth_url}",
-                                     data=json.dumps(payload), headers=headers)
+            response = self._session.post(f"{self._auth_url}",
+                                          data=json.dumps(payload), headers=headers)
             if response.status_code == ResponseCode.OK:
                 response_data = response.json()
                 if response_data.get('access_token'):
@@ -195,7 +208,7 @@ class API:
         """
         try:
             headers = {'Authorization': f'Bearer {self._api_token}','Content-Type': 'application/json'}
-            response = requests.get(f'{self._api_url}{path}', headers=headers)
+            response = self._session.get(f'{self._api_url}{path}', headers=headers)
             if response.status_code == ResponseCode.OK:
                 self._logger.debug("Get request succeeded for path: %s", path)
                 return response.json()
@@ -241,7 +254,7 @@ class API:
         try:
             headers = {'Authorization': f'Bearer {self._api_token}','Content-Type': 'application/json'}
             payload = json.dumps(data)
-            response = requests.put(f'{self._api_url}{path}', data=payload, headers=headers)
+            response = self._session.put(f'{self._api_url}{path}', data=payload, headers=headers)
             if response.status_code == ResponseCode.OK:
                 self._logger.debug("Put request succeeded")
                 return response.json()
@@ -311,16 +324,20 @@ class API:
         if not response:
             return []
 
+        # Built fresh on every call, so a repeated (or late, timed-out)
+        # call can't leave duplicates behind
+        devices = []
         for entry in response:
             mac = entry.get("deviceIdentifier","")
             if len(mac) != 12:
                 pass
             else:
-                self._devices.append(Device(device_id=mac,api=self))
+                devices.append(Device(device_id=mac,api=self))
+        self._devices = devices
 
-        if not self._devices:
+        if not devices:
             self._logger.debug("Could not find any device")
-        return self._devices.copy()
+        return devices.copy()
 
     def get_device(self:API,deviceID:str, skip_fetch:bool = True) -> Device | None:
         """
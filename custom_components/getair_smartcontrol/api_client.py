@@ -1,12 +1,23 @@
 """API Client für getAir SmartControl Integration."""
+import hashlib
 import logging
-import json
+import os
+from functools import partial
 from pathlib import Path
-import sys
+
+import aiofiles
+import orjson
+
+from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _private_opener(path: str, flags: int) -> int:
+    """Open files with owner-only permissions (0600) on creation."""
+    return os.open(path, flags, 0o600)
+
+
 class GetAirAPIClient:
     """Wrapper um die getAir API für Home Assistant Integration."""
 
@@ -20,27 +31,33 @@ class GetAirAPIClient:
         _LOGGER.debug("Initializing GetAirAPIClient with credentials for user: %s", 
                      credentials_data.get("username", "unknown"))
         self.credentials_data = credentials_data
+        self._credentials_bytes = orjson.dumps(credentials_data)
         self._api = None
         self._api_class = None
+
+        # Capabilities of the api_cc1 API object, probed once on creation
+        self._cap_reconnect_flag = False
+        self._cap_devices_cache = False
+        self._cap_auto_reconnect = False
+        self._cap_get_devices = False
         
         # Determine credentials file path
         if config_path:
             # Use HA's .storage directory which is always writable
+            # (created lazily when the credentials file is first written)
             storage_dir = Path(config_path) / ".storage"
-            storage_dir.mkdir(parents=True, exist_ok=True)
             self._credentials_path = storage_dir / "getair_credentials.json"
             _LOGGER.debug("Using HA storage path: %s", self._credentials_path)
         else:
             # Fallback to /tmp with unique name
-            import hashlib
             user_hash = hashlib.md5(credentials_data.get("username", "default").encode()).hexdigest()[:8]
             self._credentials_path = Path(f"/tmp/.getair_credentials_{user_hash}")
             _LOGGER.warning("No config_path provided, using temporary path: %s", self._credentials_path)
-        
-        self._initialize_api()
+
+        # api_cc1 is imported lazily on the first connect (in the executor)
 
     def _initialize_api(self):
-        """Initialize the API from the local api_cc1 module."""
+        """Initialize the API from the local api_cc1 module (blocking import)."""
         try:
             _LOGGER.debug("Attempting to import api_cc1 module...")
             # Import the API class from the local api_cc1 module
@@ -51,111 +68,174 @@ class GetAirAPIClient:
             _LOGGER.error("Could not import api_cc1 module: %s", err, exc_info=True)
             raise
 
+    def _credentials_file_matches(self) -> bool:
+        """Check if the credentials file already holds the intended bytes (blocking)."""
+        try:
+            return self._credentials_path.read_bytes() == self._credentials_bytes
+        except OSError:
+            return False
+
+    def _write_credentials_file(self) -> None:
+        """Write the credentials file with restrictive permissions (blocking)."""
+        if self._credentials_file_matches():
+            _LOGGER.debug("Credentials file unchanged, skipping write")
+            return
+
+        # Ensure parent directory exists
+        self._credentials_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self._credentials_path, "wb", opener=_private_opener) as f:
+            f.write(self._credentials_bytes)
+
+    async def _async_write_credentials_file(self, hass: HomeAssistant) -> None:
+        """Write the credentials file without blocking the event loop."""
+        try:
+            async with aiofiles.open(self._credentials_path, "rb") as f:
+                if await f.read() == self._credentials_bytes:
+                    _LOGGER.debug("Credentials file unchanged, skipping write")
+                    return
+        except OSError:
+            pass
+
+        await hass.async_add_executor_job(
+            partial(self._credentials_path.parent.mkdir, parents=True, exist_ok=True)
+        )
+
+        async with aiofiles.open(
+            self._credentials_path, "wb", opener=_private_opener
+        ) as f:
+            await f.write(self._credentials_bytes)
+
+    def _prepare_api(self) -> bool:
+        """
+        Prepare the API object for a (re-)connect.
+
+        Reuses an existing API object or creates a new one from the
+        credentials file. Does not perform any network I/O.
+
+        :return: True if the API object is ready to connect
+        """
+        if self._api is not None:
+            _LOGGER.debug("connect: Reusing existing API object for reconnection")
+
+            # Reset reconnect flag if it exists
+            if self._cap_reconnect_flag:
+                self._api._reconnect_in_progress = False
+
+            # CRITICAL: Clear device cache so get_device() creates fresh device with new API state
+            if self._cap_devices_cache:
+                self._api._devices.clear()
+                _LOGGER.debug("connect: Cleared device cache to force fresh device objects")
+            return True
+
+        # Initialize API with persistent credentials path
+        _LOGGER.debug("connect: Initializing API class with credentials file...")
+        try:
+            self._api = self._api_class(str(self._credentials_path))
+
+            # Probe optional API capabilities once instead of on every reconnect
+            self._cap_reconnect_flag = hasattr(self._api, '_reconnect_in_progress')
+            self._cap_devices_cache = hasattr(self._api, '_devices')
+            self._cap_auto_reconnect = hasattr(self._api, 'AUTO_RECONNECT')
+            self._cap_get_devices = hasattr(self._api, 'get_devices')
+
+            # CRITICAL: Disable AUTO_RECONNECT to avoid conflicts with our reconnect logic
+            # We manage reconnects ourselves in the coordinator
+            if self._cap_auto_reconnect:
+                self._api.AUTO_RECONNECT = False
+                _LOGGER.debug("connect: Disabled AUTO_RECONNECT in api_cc1")
+
+            _LOGGER.debug("connect: API class initialized with persistent credentials")
+            return True
+        except Exception as init_err:
+            _LOGGER.error("connect: Failed to initialize API class: %s", init_err, exc_info=True)
+            self._api = None
+            return False
+
+    def _connect_api(self) -> bool:
+        """
+        Authenticate the prepared API object (blocking network I/O).
+
+        :return: True if successful
+        """
+        _LOGGER.debug("connect: Calling API.connect()...")
+        try:
+            connect_result = self._api.connect()
+            _LOGGER.debug("connect: API.connect() returned: %s (type: %s)",
+                        connect_result, type(connect_result).__name__)
+
+            if connect_result is None:
+                _LOGGER.error("connect: API.connect() returned None - authentication failed")
+                return False
+
+            _LOGGER.info("connect: Successfully connected to getAir API")
+            return True
+
+        except Exception as conn_err:
+            _LOGGER.error("connect: API.connect() raised exception: %s", conn_err, exc_info=True)
+            return False
+
     def connect(self) -> bool:
         """
-        Connect to the API.
+        Connect to the API (blocking, run in executor).
 
         :return: True if successful
         """
         _LOGGER.debug("connect: Starting connection attempt...")
-        
+
         try:
-            # Check if we already have an API object - if yes, just reconnect it
-            if self._api is not None:
-                _LOGGER.debug("connect: Reusing existing API object for reconnection")
-                
-                # Ensure credentials file exists  
-                if not self._credentials_path.exists():
-                    _LOGGER.warning("connect: Credentials file missing, recreating...")
-                    self._credentials_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(self._credentials_path, "w") as f:
-                        json.dump(self.credentials_data, f)
-                    import os
-                    os.chmod(self._credentials_path, 0o600)
-                
-                # Reset reconnect flag if it exists
-                if hasattr(self._api, '_reconnect_in_progress'):
-                    self._api._reconnect_in_progress = False
-                
-                # CRITICAL: Clear device cache so get_device() creates fresh device with new API state
-                if hasattr(self._api, '_devices'):
-                    self._api._devices.clear()
-                    _LOGGER.debug("connect: Cleared device cache to force fresh device objects")
-                
-                # Call connect on existing API object
-                _LOGGER.debug("connect: Calling API.connect() on existing object...")
-                connect_result = self._api.connect()
-                _LOGGER.debug("connect: API.connect() returned: %s", connect_result is not None)
-                
-                if connect_result is None:
-                    _LOGGER.error("connect: API.connect() returned None - authentication failed")
-                    return False
-                
-                _LOGGER.info("connect: Successfully reconnected to getAir API (reused existing API object)")
-                return True
-            
-            # First time connection - create new API object
-            _LOGGER.debug("connect: First connection, creating new API object...")
-            
-            if not self._api_class:
-                _LOGGER.error("connect: API class not initialized")
-                return False
+            if self._api_class is None:
+                self._initialize_api()
 
-            # Write credentials to persistent file
+            # Write credentials to persistent file (skipped if unchanged)
             _LOGGER.debug("connect: Writing credentials to %s", self._credentials_path)
-            
             try:
-                # Ensure parent directory exists
-                self._credentials_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(self._credentials_path, "w") as f:
-                    json.dump(self.credentials_data, f)
-                
-                # Set restrictive permissions (owner read/write only)
-                import os
-                os.chmod(self._credentials_path, 0o600)
-                
+                self._write_credentials_file()
                 _LOGGER.debug("connect: Credentials file written successfully to persistent location")
             except Exception as file_err:
                 _LOGGER.error("connect: Failed to write credentials file: %s", file_err)
                 return False
 
-            # Initialize API with persistent credentials path
-            _LOGGER.debug("connect: Initializing API class with credentials file...")
-            try:
-                self._api = self._api_class(str(self._credentials_path))
-                
-                # CRITICAL: Disable AUTO_RECONNECT to avoid conflicts with our reconnect logic
-                # We manage reconnects ourselves in the coordinator
-                if hasattr(self._api, 'AUTO_RECONNECT'):
-                    self._api.AUTO_RECONNECT = False
-                    _LOGGER.debug("connect: Disabled AUTO_RECONNECT in api_cc1")
-                
-                _LOGGER.debug("connect: API class initialized with persistent credentials")
-            except Exception as init_err:
-                _LOGGER.error("connect: Failed to initialize API class: %s", init_err, exc_info=True)
+            if not self._prepare_api():
                 return False
 
-            # Connect to API
-            _LOGGER.debug("connect: Calling API.connect()...")
+            return self._connect_api()
+
+        except Exception as err:
+            _LOGGER.error("connect: Unexpected error during connection: %s", err, exc_info=True)
+            return False
+
+    async def async_connect(self, hass: HomeAssistant) -> bool:
+        """
+        Connect to the API from the event loop.
+
+        The credentials file is written natively async; only the blocking
+        authentication round-trip is offloaded to the executor.
+
+        :param hass: Home Assistant instance
+        :return: True if successful
+        """
+        _LOGGER.debug("async_connect: Starting connection attempt...")
+
+        try:
+            if self._api_class is None:
+                await hass.async_add_executor_job(self._initialize_api)
+
+            _LOGGER.debug("async_connect: Writing credentials to %s", self._credentials_path)
             try:
-                connect_result = self._api.connect()
-                _LOGGER.debug("connect: API.connect() returned: %s (type: %s)", 
-                            connect_result, type(connect_result).__name__)
-                
-                if connect_result is None:
-                    _LOGGER.error("connect: API.connect() returned None - authentication failed")
-                    return False
-                
-                _LOGGER.info("connect: Successfully connected to getAir API")
-                return True
-                
-            except Exception as conn_err:
-                _LOGGER.error("connect: API.connect() raised exception: %s", conn_err, exc_info=True)
+                await self._async_write_credentials_file(hass)
+                _LOGGER.debug("async_connect: Credentials file written successfully to persistent location")
+            except Exception as file_err:
+                _LOGGER.error("async_connect: Failed to write credentials file: %s", file_err)
+                return False
+
+            if not self._prepare_api():
                 return False
 
+            return await hass.async_add_executor_job(self._connect_api)
+
         except Exception as err:
-            _LOGGER.error("connect: Unexpected error during connection: %s", err, exc_info=True)
+            _LOGGER.error("async_connect: Unexpected error during connection: %s", err, exc_info=True)
             return False
 
     def get_device(self, device_id: str, skip_fetch: bool = True):
@@ -187,6 +267,11 @@ class GetAirAPIClient:
             _LOGGER.error("get_device: Error getting device %s: %s", device_id, err, exc_info=True)
             return None
 
+    @property
+    def supports_get_devices(self) -> bool:
+        """Return True if the API object supports device enumeration."""
+        return self._cap_get_devices
+
     def is_connected(self) -> bool:
         """Check if API is connected."""
         if self._api is None:
@@ -201,6 +286,15 @@ class GetAirAPIClient:
             _LOGGER.error("is_connected: Error checking connection status: %s", err)
             return False
 
+    def close(self) -> None:
+        """Close the API's pooled HTTP connections (blocking, run in executor)."""
+        if self._api is not None and hasattr(self._api, 'close'):
+            try:
+                self._api.close()
+                _LOGGER.debug("close: Closed API HTTP session")
+            except Exception as err:
+                _LOGGER.debug("close: Error closing API HTTP session: %s", err)
+
     def ensure_credentials_file(self) -> bool:
         """
         Ensure the credentials file exists.
@@ -217,16 +311,7 @@ class GetAirAPIClient:
                     self._credentials_path
                 )
                 
-                # Ensure parent directory exists
-                self._credentials_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Write credentials
-                with open(self._credentials_path, "w") as f:
-                    json.dump(self.credentials_data, f)
-                
-                # Set restrictive permissions
-                import os
-                os.chmod(self._credentials_path, 0o600)
+                self._write_credentials_file()
                 
                 _LOGGER.info("ensure_credentials_file: Credentials file recreated successfully")
                 return True
@@ -1,22 +1,26 @@
 """Binary sensor entities for getAir SmartControl."""
 import logging
 from dataclasses import dataclass
+from typing import Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .coordinator import GetAirCoordinator, slugify_zone_name
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing zone data
+_EMPTY: Final[dict] = {}
+
 
 @dataclass
 class GetAirBinarySensorEntityDescription(BinarySensorEntityDescription):
@@ -27,7 +31,7 @@ class GetAirBinarySensorEntityDescription(BinarySensorEntityDescription):
 
 
 # Only keep system-level binary sensors here. Zone Silent/VOC are exposed as switches.
-BINARY_SENSOR_DESCRIPTIONS = [
+BINARY_SENSOR_DESCRIPTIONS: Final[tuple[GetAirBinarySensorEntityDescription, ...]] = (
     # System-level binary sensors
     GetAirBinarySensorEntityDescription(
         key="modelock",
@@ -53,7 +57,13 @@ BINARY_SENSOR_DESCRIPTIONS = [
         data_key="auto_update_enabled",
         zone_idx=None,
     ),
-]
+)
+
+# Descriptions bucketed by zone_idx (None = system) once at import
+_DESCRIPTIONS_BY_ZONE: Final[dict[int | None, tuple[GetAirBinarySensorEntityDescription, ...]]] = {
+    zone: tuple(d for d in BINARY_SENSOR_DESCRIPTIONS if d.zone_idx == zone)
+    for zone in (None, 1, 2, 3)
+}
 
 
 class GetAirBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -67,6 +77,7 @@ class GetAirBinarySensor(CoordinatorEntity, BinarySensorEntity):
         coordinator: GetAirCoordinator,
         device_id: str,
         description: GetAirBinarySensorEntityDescription,
+        zones: dict | None = None,
     ):
         """Initialize the binary sensor entity."""
         super().__init__(coordinator)
@@ -74,18 +85,42 @@ class GetAirBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._device_id = device_id
         self._zone_idx = description.zone_idx
 
+        # Accessor for the sensor value, bound once for the is_on hot path
+        data_key = description.data_key
+        if self._zone_idx:
+            zone_idx = self._zone_idx
+            self._value_getter = lambda data: (data["zones"].get(zone_idx) or _EMPTY).get(data_key)
+        else:
+            self._value_getter = lambda data: data["system"].get(data_key)
+
+        # Name is built lazily and cached until the zone name changes
+        self._cached_name: str | None = None
+        self._last_zone_name: str | None = None
+
         # Build clean entity_id
         if self._zone_idx:
-            zone_name = coordinator.data["zones"][self._zone_idx]["name"]
-            zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-            zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
+            if zones is None:
+                zones = coordinator.data["zones"]
+            zone_name_clean = slugify_zone_name(zones[self._zone_idx]["name"])
             self._attr_unique_id = f"getair_{device_id}_zone_{self._zone_idx}_{zone_name_clean}_{description.key}"
         else:
             self._attr_unique_id = f"getair_{device_id}_{description.key}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate the cached name if the zone was renamed."""
+        if self.coordinator.data and self._zone_idx:
+            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
+            if zone_name != self._last_zone_name:
+                self._cached_name = None
+        super()._handle_coordinator_update()
+
     @property
     def name(self) -> str:
         """Return the name of the binary sensor."""
+        if self._cached_name is not None:
+            return self._cached_name
+
         # Get name from entity description
         if hasattr(self.entity_description, 'name') and self.entity_description.name:
             base_name = self.entity_description.name
@@ -96,46 +131,25 @@ class GetAirBinarySensor(CoordinatorEntity, BinarySensorEntity):
         # For zone sensors, prepend zone name
         if self._zone_idx and self.coordinator.data:
             zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} {base_name}"
-        
-        return base_name
+            self._last_zone_name = zone_name
+            self._cached_name = f"{zone_name} {base_name}"
+        else:
+            self._cached_name = base_name
+
+        return self._cached_name
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        if self._zone_idx:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-                name=zone_name,
-                manufacturer=MANUFACTURER,
-                model="SmartControl Zone",
-                via_device=(DOMAIN, self._device_id),
-            )
-        else:
-            # System device with full hardware info
-            system_data = self.coordinator.data["system"]
-            return DeviceInfo(
-                identifiers={(DOMAIN, self._device_id)},
-                name=f"getAir {system_data.get('system_type', 'SmartControl')}",
-                manufacturer=MANUFACTURER,
-                model=system_data.get("system_type", "SmartControl"),
-                sw_version=system_data.get("fw_version", "Unknown"),
-                serial_number=system_data.get("system_id", self._device_id),
-            )
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
 
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor value."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-
-        if self._zone_idx:
-            zone_data = self.coordinator.data["zones"].get(self._zone_idx, {})
-            return zone_data.get(self.entity_description.data_key)
-        else:
-            system_data = self.coordinator.data["system"]
-            return system_data.get(self.entity_description.data_key)
+        return self._value_getter(data)
 
 
 async def async_setup_entry(
@@ -144,19 +158,25 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up binary sensor entities."""
-    coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
-
-    entities = []
-
-    for description in BINARY_SENSOR_DESCRIPTIONS:
-        # Skip zone sensors if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
-
-        entity = GetAirBinarySensor(coordinator, device_id, description)
-        entities.append(entity)
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: GetAirCoordinator = entry_data["coordinator"]
+    device_id: str = entry_data["device_id"]
+    enabled_idx: frozenset[int] = entry_data["enabled_zone_idx"]
+    zones = coordinator.data.get("zones", {})
+
+    # Skip zone sensors if zone is not enabled
+    descriptions = list(_DESCRIPTIONS_BY_ZONE[None])
+    for zone_idx in sorted(enabled_idx):
+        descriptions.extend(_DESCRIPTIONS_BY_ZONE[zone_idx])
+
+    entities = [
+        GetAirBinarySensor(
+            coordinator,
+            device_id,
+            description,
+            zones=zones,
+        )
+        for description in descriptions
+    ]
 
     async_add_entities(entities)
@@ -4,34 +4,36 @@ from dataclasses import dataclass
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .coordinator import GetAirCoordinator, slugify_zone_name
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class GetAirButtonEntityDescription(ButtonEntityDescription):
     """Describe getAir button entity."""
 
     zone_idx: int | None = None
     data_key: str | None = None
     reset_value: int | float = 0
+    key_suffix: str = ""
 
 
-BUTTON_DESCRIPTIONS = []
+_descriptions: list[GetAirButtonEntityDescription] = []
 
 # Add zone-specific buttons
 for zone_idx in range(1, 4):
     # Filter runtime reset button
-    BUTTON_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirButtonEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_reset_filter_runtime",
+            key=f"zone_{zone_idx}_reset_filter_runtime",
+            key_suffix="reset_filter_runtime",
             translation_key="zone_reset_filter_runtime",
             name="Filter-Laufzeit zurücksetzen",
             data_key="last_filter_change",
@@ -42,9 +44,10 @@ for zone_idx in range(1, 4):
     )
     
     # Mode deadline reset button
-    BUTTON_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirButtonEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_reset_mode_deadline",
+            key=f"zone_{zone_idx}_reset_mode_deadline",
+            key_suffix="reset_mode_deadline",
             translation_key="zone_reset_mode_deadline",
             name="Modus-Deadline zurücksetzen",
             data_key="mode_deadline",
@@ -54,11 +57,21 @@ for zone_idx in range(1, 4):
         )
     )
 
+BUTTON_DESCRIPTIONS: tuple[GetAirButtonEntityDescription, ...] = tuple(_descriptions)
+del _descriptions
+
+# Descriptions per zone, so setup only walks the enabled zones
+BUTTON_DESCRIPTIONS_BY_ZONE: dict[int, tuple[GetAirButtonEntityDescription, ...]] = {
+    zone_idx: tuple(d for d in BUTTON_DESCRIPTIONS if d.zone_idx == zone_idx)
+    for zone_idx in range(1, 4)
+}
+
 
 class GetAirButton(CoordinatorEntity, ButtonEntity):
     """Representation of a getAir button."""
 
     _attr_has_entity_name = False
+    _attr_should_poll = False
     entity_description: GetAirButtonEntityDescription
 
     def __init__(
@@ -74,32 +87,31 @@ class GetAirButton(CoordinatorEntity, ButtonEntity):
         self._zone_idx = description.zone_idx
         
         # Build entity_id with getair prefix, device_id, and zone name
-        zone_name = coordinator.data["zones"][self._zone_idx]["name"]
-        zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-        zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
-        
-        key_with_zone = description.key.replace("{zone_name}", zone_name_clean)
-        self._attr_unique_id = f"getair_{device_id}_{key_with_zone}"
+        zone_name_clean = slugify_zone_name(coordinator.data["zones"][self._zone_idx]["name"])
+        self._attr_unique_id = (
+            f"getair_{device_id}_{self._zone_idx}_{zone_name_clean}_{description.key_suffix}"
+        )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the button."""
-        if self.coordinator.data:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} {self.entity_description.name}"
-        return self.entity_description.name
+        # The name is a plain _attr_* value, rebuilt by
+        # _handle_coordinator_update only when the zone is renamed
+        self._zone_name: str = coordinator.data["zones"][self._zone_idx]["name"]
+        self._attr_name = f"{self._zone_name} {description.name}"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up a renamed zone, then write the new state."""
+        data = self.coordinator.data
+        if data:
+            zone_name = data["zones"][self._zone_idx]["name"]
+            if zone_name != self._zone_name:
+                self._zone_name = zone_name
+                self._attr_name = f"{zone_name} {self.entity_description.name}"
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-            name=zone_name,
-            manufacturer=MANUFACTURER,
-            model="SmartControl Zone",
-            via_device=(DOMAIN, self._device_id),
-        )
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -119,14 +131,9 @@ class GetAirButton(CoordinatorEntity, ButtonEntity):
             reset_value,
         )
         
-        if success:
-            _LOGGER.info(
-                "Successfully reset %s for zone %s",
-                data_key,
-                self._zone_idx,
-            )
-            await self.coordinator.async_request_refresh()
-        else:
+        # On success the coordinator has already applied the value to its
+        # data and scheduled the reconciling refresh itself
+        if not success:
             _LOGGER.error(
                 "Failed to reset %s for zone %s",
                 data_key,
@@ -142,17 +149,17 @@ async def async_setup_entry(
     """Set up button entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
-
-    entities = []
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
-    for description in BUTTON_DESCRIPTIONS:
-        # Skip zone buttons if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
+    entities = [
+        GetAirButton(coordinator, device_id, description)
+        for zone_idx in sorted(enabled_idx)
+        for description in BUTTON_DESCRIPTIONS_BY_ZONE[zone_idx]
+    ]
 
-        entity = GetAirButton(coordinator, device_id, description)
-        entities.append(entity)
+    if not entities:
+        return
 
-    async_add_entities(entities)
+    # Buttons are stateless and read everything from the coordinator, which
+    # has already refreshed at this point, so no pre-add update is needed
+    async_add_entities(entities, update_before_add=False)
@@ -1,4 +1,5 @@
 """Config flow for getAir SmartControl integration."""
+import asyncio
 import logging
 from typing import Any, Dict
 
@@ -8,11 +9,22 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN, CONF_AUTH_URL, CONF_API_URL, CONF_DEVICE_ID, CLIENT_ID
+from .const import DOMAIN, CONF_AUTH_URL, CONF_API_URL, CONF_DEVICE_ID, get_client_id
 from .api_client import GetAirAPIClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound for a single get_devices() round-trip during discovery
+DEVICE_DISCOVERY_TIMEOUT = 10
+
+# Credentials form, identical on every (re)show of the user step
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_AUTH_URL, default="https://auth.getair.eu/oauth/token"): str,
+    vol.Required(CONF_API_URL, default="https://be01.ga-cc.de/api/v1/"): str,
+    vol.Required(CONF_USERNAME): str,
+    vol.Required(CONF_PASSWORD): str,
+})
+
 
 class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for getAir SmartControl."""
@@ -23,6 +35,8 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize config flow."""
         self._credentials: Dict[str, Any] = {}
         self._devices: list = []
+        self._device_options: Dict[str, str] = {}
+        self._device_name_by_id: Dict[str, str] = {}
 
     async def async_step_user(
         self, user_input: Dict[str, Any] | None = None
@@ -34,12 +48,13 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             _LOGGER.info("=" * 80)
             _LOGGER.info("Config flow: User credentials received")
-            _LOGGER.debug(
-                "Credentials (without password): auth_url=%s, api_url=%s, username=%s",
-                user_input.get(CONF_AUTH_URL),
-                user_input.get(CONF_API_URL),
-                user_input.get(CONF_USERNAME),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Credentials (without password): auth_url=%s, api_url=%s, username=%s",
+                    user_input.get(CONF_AUTH_URL),
+                    user_input.get(CONF_API_URL),
+                    user_input.get(CONF_USERNAME),
+                )
             
             try:
                 _LOGGER.info("Validating credentials and fetching devices...")
@@ -48,9 +63,7 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._credentials = user_input
                 
                 # Fetch available devices
-                devices = await self.hass.async_add_executor_job(
-                    self._get_devices, user_input
-                )
+                devices = await self._async_get_devices(user_input)
                 
                 if not devices:
                     _LOGGER.error("No devices found for this account")
@@ -59,6 +72,13 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 else:
                     _LOGGER.info("Found %d device(s)", len(devices))
                     self._devices = devices
+                    self._device_name_by_id = {
+                        d["device_id"]: d["name"] for d in devices
+                    }
+                    self._device_options = {
+                        d["device_id"]: f"{d['name']} ({d['device_id']})"
+                        for d in devices
+                    }
                     
                     # If only one device, skip selection step
                     if len(devices) == 1:
@@ -85,16 +105,9 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             _LOGGER.info("=" * 80)
 
-        schema = vol.Schema({
-            vol.Required(CONF_AUTH_URL, default="https://auth.getair.eu/oauth/token"): str,
-            vol.Required(CONF_API_URL, default="https://be01.ga-cc.de/api/v1/"): str,
-            vol.Required(CONF_USERNAME): str,
-            vol.Required(CONF_PASSWORD): str,
-        })
-
         return self.async_show_form(
             step_id="user",
-            data_schema=schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
             description_placeholders=placeholders,
         )
@@ -117,10 +130,7 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data = {**self._credentials, CONF_DEVICE_ID: device_id}
             
             # Find device name for title
-            device_name = next(
-                (d["name"] for d in self._devices if d["device_id"] == device_id),
-                device_id
-            )
+            device_name = self._device_name_by_id.get(device_id, device_id)
             
             return self.async_create_entry(
                 title=f"getAir {device_name}",
@@ -128,13 +138,8 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
         
         # Build device selection schema
-        device_options = {
-            d["device_id"]: f"{d['name']} ({d['device_id']})"
-            for d in self._devices
-        }
-        
         schema = vol.Schema({
-            vol.Required(CONF_DEVICE_ID): vol.In(device_options),
+            vol.Required(CONF_DEVICE_ID): vol.In(self._device_options),
         })
         
         return self.async_show_form(
@@ -146,10 +151,13 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
-    def _get_devices(self, credentials: Dict[str, Any]) -> list:
+    async def _async_get_devices(self, credentials: Dict[str, Any]) -> list:
         """
         Get list of available devices.
-        
+
+        Runs on the event loop; only the blocking api_cc1 calls are
+        offloaded to the executor, retry delays do not hold a worker thread.
+
         :param credentials: User credentials
         :return: List of devices with device_id and name
         :raises CannotConnect: If API connection fails
@@ -160,17 +168,18 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         credentials_data = {
             "auth_url": credentials[CONF_AUTH_URL],
             "api_url": credentials[CONF_API_URL],
-            "client_id": CLIENT_ID,
+            "client_id": get_client_id(),
             "username": credentials[CONF_USERNAME],
             "password": credentials[CONF_PASSWORD],
         }
 
+        api_client = None
         try:
             _LOGGER.info("Creating API client")
             api_client = GetAirAPIClient(credentials_data, config_path=None)
             
             _LOGGER.info("Connecting to API")
-            if not api_client.connect():
+            if not await api_client.async_connect(self.hass):
                 _LOGGER.error("API connection failed")
                 raise CannotConnect("Could not authenticate with API")
             
@@ -178,41 +187,42 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             
             # Get devices from API - with retries since token might need time to activate
             _LOGGER.info("Fetching device list (with retries)")
-            if not hasattr(api_client._api, 'get_devices'):
+            if not api_client.supports_get_devices:
                 _LOGGER.error("API does not support get_devices()")
                 raise CannotConnect("API does not support device enumeration")
             
-            # Try multiple times with delays - same pattern as coordinator
-            import time
+            # Try multiple times with exponential backoff (0.25 s, 0.5 s);
+            # sleeps only happen between attempts, never after the last one
             max_retries = 3
-            api_devices = None
+            wait_time = 0.25
+            get_devices = api_client._api.get_devices
             
-            for attempt in range(max_retries):
-                _LOGGER.debug("Device discovery attempt %d/%d", attempt + 1, max_retries)
+            for attempt in range(1, max_retries + 1):
+                _LOGGER.debug("Device discovery attempt %d/%d", attempt, max_retries)
                 
                 try:
-                    api_devices = api_client._api.get_devices()
+                    async with asyncio.timeout(DEVICE_DISCOVERY_TIMEOUT):
+                        api_devices = await self.hass.async_add_executor_job(get_devices)
                     
-                    if api_devices and len(api_devices) > 0:
+                    if api_devices:
                         _LOGGER.info("Successfully discovered %d device(s)", len(api_devices))
                         break
-                    else:
-                        _LOGGER.warning("get_devices() returned empty list on attempt %d", attempt + 1)
+                    
+                    _LOGGER.warning("get_devices() returned empty list on attempt %d", attempt)
                         
                 except Exception as get_err:
-                    _LOGGER.warning("get_devices() failed on attempt %d: %s", attempt + 1, get_err)
+                    _LOGGER.warning("get_devices() failed on attempt %d: %s", attempt, get_err)
                 
-                # Wait before retry (except on last attempt)
-                if attempt < max_retries - 1:
-                    wait_time = 0.5
+                if attempt < max_retries:
                     _LOGGER.debug("Waiting %s seconds before retry...", wait_time)
-                    time.sleep(wait_time)
-            
-            if not api_devices:
+                    await asyncio.sleep(wait_time)
+                    wait_time *= 2
+            else:
                 _LOGGER.warning("No devices found after %d attempts", max_retries)
                 return []
             
             # Convert to our format
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
             devices = []
             for dev in api_devices:
                 device_id = dev.device_id
@@ -222,7 +232,8 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "device_id": device_id,
                     "name": device_name,
                 })
-                _LOGGER.debug("Found device: %s (%s)", device_name, device_id)
+                if debug_enabled:
+                    _LOGGER.debug("Found device: %s (%s)", device_name, device_id)
             
             return devices
 
@@ -231,6 +242,10 @@ class GetAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         except Exception as err:
             _LOGGER.exception("Error fetching devices: %s", str(err))
             raise CannotConnect(f"Failed to fetch devices: {err}")
+        finally:
+            # The client only lives for discovery; release its HTTP session
+            if api_client is not None:
+                await self.hass.async_add_executor_job(api_client.close)
 
     @staticmethod
     def async_get_options_flow(
@@ -1,6 +1,6 @@
 """Constants for getAir SmartControl integration."""
-"""Constants for getAir SmartControl integration."""
 import os
+from functools import lru_cache
 
 DOMAIN = "getair_smartcontrol"
 MANUFACTURER = "getAir"
@@ -13,7 +13,13 @@ CONF_DEVICE_ID = "device_id"
 # Client ID - loaded from environment variable for security
 # Can be set via: export GETAIR_CLIENT_ID="your_client_id"
 # Fallback to default if not set
-CLIENT_ID = os.getenv("GETAIR_CLIENT_ID", "7jPuzDmLiKFF6oPtvsFUhBkyPahA7Lh5")
+DEFAULT_CLIENT_ID = "7jPuzDmLiKFF6oPtvsFUhBkyPahA7Lh5"
+
+
+@lru_cache(maxsize=1)
+def get_client_id() -> str:
+    """Return the OAuth client ID (read from the environment on first use)."""
+    return os.getenv("GETAIR_CLIENT_ID", DEFAULT_CLIENT_ID)
 
 # Modes
 MODES = ["ventilate", "ventilate_hr", "ventilate_inv", "night", "auto", "rush"]
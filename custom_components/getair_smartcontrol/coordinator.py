@@ -1,19 +1,122 @@
 """DataUpdateCoordinator für getAir SmartControl."""
 import asyncio
 import logging
+import operator
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
 from .api_client import GetAirAPIClient
+from .const import DOMAIN, MANUFACTURER
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=60)
 
+# Matches every character that is neither alphanumeric nor "_" (same set as
+# str.isalnum(), so umlauts are kept and existing unique IDs stay stable)
+_SLUG_RE = re.compile(r"\W")
+
+
+@lru_cache(maxsize=128)
+def slugify_zone_name(zone_name: str) -> str:
+    """Sanitize a zone name for use in unique IDs."""
+    return _SLUG_RE.sub("_", zone_name.lower())
+
+
+# Backoff between fetch retries within one update (seconds)
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 30
+# Upper bound for skipping polls after consecutive failed updates (seconds)
+FAILURE_BACKOFF_MAX = 300
+# (index, name key, data key) for the 10 time profiles
+_PROFILE_KEYS = tuple(
+    (i, f"time_profile_{i}_name", f"time_profile_{i}_data") for i in range(1, 11)
+)
+
+# Required device attributes, fetched in one attrgetter call: keys and paths
+_DEVICE_KEYS = (
+    "system_id",
+    "system_type",
+    "fw_version",
+    "air_quality",
+    "air_pressure",
+    "humidity",
+    "temperature",
+    "runtime",
+)
+_DEVICE_FIELDS = operator.attrgetter(
+    "device_id",
+    "system_type",
+    "fw_app_version_str",
+    "air_quality",
+    "air_pressure",
+    "indoor_humidity",
+    "indoor_temperature",
+    "_system.runtime",
+)
+
+# Optional device._system attributes copied into system data: (name, default)
+_SYSTEM_FIELDS = (
+    ("iaq_accuracy", None),
+    ("num_zones", 3),
+    ("modelock", False),
+    ("notification", ""),
+    ("supports_auto_update", False),
+    ("auto_update_enabled", False),
+)
+
+# Zone data fields: (key, Device._Zone attribute, Device property, default)
+_ZONE_FIELDS = (
+    ("name", "name", "name", None),
+    ("speed", "speed", "speed", None),
+    ("mode", "mode", "mode", None),
+    ("temperature", "temperature", "temperature", None),
+    ("humidity", "humidity", "humidity", None),
+    ("outdoor_temp", "temp_outdoors", "outdoor_temperature", None),
+    ("outdoor_humidity", "hmdty_outdoors", "outdoor_humidity", None),
+    ("runtime", "runtime", "runtime", None),
+    ("last_filter_change", "last_filter_change", "last_filter_change", None),
+    ("target_temp", "target_temp", "target_temp", None),
+    ("target_hmdty_level", "target_hmdty_level", "target_hmdty_level", None),
+    ("auto_mode_voc", "auto_mode_voc", "auto_mode_voc", False),
+    ("auto_mode_silent", "auto_mode_silent", "auto_mode_silent", False),
+    ("mode_deadline", "mode_deadline", "mode_deadline", 0),
+    ("time_profile", "time_profile", "active_time_profile", 0),
+)
+
+# Device property name -> zone data key, for optimistic updates
+_ZONE_KEY_BY_PROPERTY = {device_attr: key for key, _, device_attr, _ in _ZONE_FIELDS}
+
+# How long a device handle from api_client.get_device() is reused (seconds)
+DEVICE_CACHE_TTL = 300
+# Refresh requests (e.g. several setters in a row) within this window are
+# coalesced into a single poll (seconds)
+REFRESH_COOLDOWN = 1.0
+# Refresh requests are ignored while the last fetch is younger than this,
+# unless a change was made since (seconds)
+MIN_REFRESH_INTERVAL = 5.0
+# Property writes are pushed once no new write arrived for this long, so a
+# dragged slider is sent once it settles (seconds)
+WRITE_COALESCE_WINDOW = 0.3
+# Upper bound for holding back the first queued write (seconds)
+WRITE_COALESCE_MAX_DELAY = 2.0
+
+
+def _jitter(delay: float) -> float:
+    """Spread a delay randomly over 50-150% to avoid synchronized retries."""
+    return delay * random.uniform(0.5, 1.5)
+
 
 class GetAirCoordinator(DataUpdateCoordinator):
     """Coordinator für getAir SmartControl API-Updates."""
@@ -38,15 +141,93 @@ class GetAirCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="GetAir SmartControl",
             update_interval=timedelta(seconds=polling_interval),
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self.api_client = api_client
         self.device_id = device_id
+
+        # Failed updates in a row; while backing off, polls return cached data
+        self._consecutive_failures = 0
+        self._next_retry_at = 0.0
+
+        # Own small pool for blocking getAir I/O, so a slow backend can't
+        # starve HA's shared executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="getair"
+        )
+
+        # Device handle reused between polls and service calls, dropped on reconnect
+        self._cached_device = None
+        self._cached_device_expiry = 0.0
+        self._methods_logged = False
+        # Set once device._zones was seen to hold zones 1-3
+        self._zone_schema_validated = False
+
+        # (raw boot_time, formatted ISO string) of the last poll
+        self._boot_time_cache: tuple[int | None, str | None] = (None, None)
+
+        # Queued (zone_idx or None, property, value, future) writes, pushed
+        # together once the write window has passed
+        self._pending_writes: list[tuple[int | None, str, Any, asyncio.Future]] = []
+        self._write_timer: asyncio.TimerHandle | None = None
+        self._write_window_started: float | None = None
+        self._write_flush_task: asyncio.Task | None = None
+
+        # Set by async_shutdown once the executor has been shut down
+        self._closed = False
+
+        # Monotonic time of the last successful fetch, 0 marks data as stale
+        self._last_fetch_monotonic = 0.0
+
+        # Sanitized zone names for unique IDs, filled from the first refresh
+        self.zone_clean_names: dict[int, str] = {}
+
+        # (source key, DeviceInfo) per zone index, None for the system device;
+        # one shared object per device instead of one per entity
+        self._device_info_cache: dict[int | None, tuple[Any, DeviceInfo]] = {}
+
+        # Wall-clock time of the current listener update, one shared "now"
+        # for every entity computing a value in that update
+        self.now_unix = int(time.time())
         _LOGGER.info(
             "Coordinator initialized for device %s with polling interval %ds",
             device_id,
             polling_interval,
         )
 
+    def _async_add_executor_job(self, target, *args) -> asyncio.Future:
+        """Run a blocking call in the coordinator's own executor."""
+        return self.hass.loop.run_in_executor(self._executor, target, *args)
+
+    async def async_shutdown(self) -> None:
+        """
+        Shut down the coordinator, its HTTP session and its executor.
+
+        Safe to call more than once: the base class registers it for entry
+        unload and setup/unload also call it directly.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await super().async_shutdown()
+        if self._write_timer is not None:
+            self._write_timer.cancel()
+            self._write_timer = None
+        if self._write_flush_task is not None and not self._write_flush_task.done():
+            self._write_flush_task.cancel()
+        self._write_flush_task = None
+        for _, _, _, future in self._pending_writes:
+            if not future.done():
+                future.set_result(False)
+        self._pending_writes.clear()
+        await self._async_add_executor_job(self.api_client.close)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     async def _async_update_data(self) -> Dict[str, Any]:
         """
         Fetch data from the API.
@@ -57,23 +238,25 @@ class GetAirCoordinator(DataUpdateCoordinator):
         """
         _LOGGER.debug("Starting data update for device %s", self.device_id)
 
-        try:
-            # Check API connection status
-            if not self.api_client.is_connected():
-                _LOGGER.warning("API client not connected, attempting reconnection...")
-                reconnect_success = await self.hass.async_add_executor_job(
-                    self.api_client.connect
-                )
-                if not reconnect_success:
-                    _LOGGER.error("Failed to reconnect to API")
-                    raise ConfigEntryAuthFailed("API authentication failed - reconnection unsuccessful")
-                _LOGGER.info("Successfully reconnected to API")
-
-            # Fetch device data in a separate thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            device_data = await loop.run_in_executor(
-                None, self._fetch_device_data
+        # Still backing off after consecutive failures - don't hit the API
+        if self.data and time.monotonic() < self._next_retry_at:
+            _LOGGER.debug(
+                "Backing off after %d failed update(s), returning cached data",
+                self._consecutive_failures,
             )
+            return self.data
+
+        try:
+            # Fetch device data; blocking calls (including a reconnect if the
+            # client lost its token) run in the executor, retry delays are
+            # awaited on the event loop
+            device_data = await self._fetch_with_retries()
+
+            if not self.zone_clean_names:
+                self.zone_clean_names = {
+                    zone_idx: slugify_zone_name(zone_data["name"])
+                    for zone_idx, zone_data in device_data["zones"].items()
+                }
 
             _LOGGER.debug("Data update successful for device %s", self.device_id)
             return device_data
@@ -91,203 +274,375 @@ class GetAirCoordinator(DataUpdateCoordinator):
             )
             raise UpdateFailed(f"Error communicating with getAir API: {err}")
 
-    def _fetch_device_data(self) -> Dict[str, Any]:
+    async def _fetch_with_retries(self) -> Dict[str, Any]:
         """
-        Fetch device data from the API (runs in executor).
+        Fetch device data with fetch retries and reconnect.
+
+        Each attempt is a single executor call without sleeps; the delays
+        between attempts are awaited so no executor thread is blocked.
 
         :return: Dictionary with system and zone data
+        :raises UpdateFailed: If no data could be fetched and no cache exists
+        """
+        # CRITICAL: First fetch after connect() often fails with 401
+        # Always try twice to handle token activation delay
+        data = await self._async_add_executor_job(self._fetch_device_data_once)
+        if data is not None:
+            self._mark_fetch_success()
+            return data
+
+        _LOGGER.info("_fetch_with_retries: First fetch failed, retrying (token may need time to activate)...")
+
+        # Short wait for token to become active
+        await asyncio.sleep(0.3)
+
+        # Second attempt - this usually succeeds
+        data = await self._async_add_executor_job(self._fetch_device_data_once)
+        if data is not None:
+            _LOGGER.info("_fetch_with_retries: Second fetch succeeded!")
+            self._mark_fetch_success()
+            return data
+
+        # Both immediate attempts failed - now try reconnect
+        _LOGGER.warning(
+            "_fetch_with_retries: Both initial fetch attempts failed. Attempting reconnection..."
+        )
+
+        if await self._async_add_executor_job(self._reconnect_sync):
+            # Try right away; if the new token isn't active yet, the retries
+            # below back off exponentially instead of a blind fixed wait
+            _LOGGER.info("_fetch_with_retries: Reconnection successful, fetching again...")
+
+            # Try multiple times with delays - matches what status_abfragen.py does
+            max_retries = 3
+            for retry_attempt in range(max_retries):
+                _LOGGER.debug(
+                    "_fetch_with_retries: Retry attempt %d/%d...",
+                    retry_attempt + 1,
+                    max_retries
+                )
+
+                data = await self._async_add_executor_job(self._fetch_device_data_once)
+                if data is not None:
+                    _LOGGER.info("_fetch_with_retries: Fetch successful on retry %d", retry_attempt + 1)
+                    self._mark_fetch_success()
+                    return data
+
+                # If not the last retry, wait before trying again
+                if retry_attempt < max_retries - 1:
+                    wait_time = _jitter(
+                        min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** retry_attempt)
+                    )
+                    _LOGGER.debug("_fetch_with_retries: Waiting %s seconds before next retry...", wait_time)
+                    await asyncio.sleep(wait_time)
+
+            _LOGGER.error("_fetch_with_retries: All %d retry attempts failed", max_retries)
+        else:
+            _LOGGER.error("_fetch_with_retries: Reconnection failed")
+
+        # Still failing after retry - skip the next poll(s) exponentially
+        self._consecutive_failures += 1
+        backoff = _jitter(
+            min(
+                FAILURE_BACKOFF_MAX,
+                self.update_interval.total_seconds() * 2 ** (self._consecutive_failures - 1),
+            )
+        )
+        self._next_retry_at = time.monotonic() + backoff
+        _LOGGER.debug(
+            "_fetch_with_retries: %d consecutive failure(s), next API attempt in %.0fs",
+            self._consecutive_failures,
+            backoff,
+        )
+
+        error_info = await self._async_add_executor_job(self._describe_fetch_failure)
+
+        _LOGGER.warning(
+            "_fetch_with_retries: device.fetch() failed for device %s after retry. "
+            "Details: %s. "
+            "Returning cached data to keep polling alive. "
+            "This could indicate: authentication issues, network problems, "
+            "or device not responding.",
+            self.device_id,
+            error_info
+        )
+
+        # CRITICAL: Return cached data instead of raising exception!
+        # This prevents the coordinator from stopping polling due to backoff
+        if self.data:
+            _LOGGER.info("_fetch_with_retries: Returning cached data to keep coordinator polling")
+            return self.data
+
+        # First update ever failed - we have to raise
+        _LOGGER.error("_fetch_with_retries: No cached data available, raising exception")
+        raise UpdateFailed(f"First fetch failed - no cached data available. {error_info}")
+
+    @staticmethod
+    def _finish_zone_data(zone_idx: int, zone_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in name fallback and zone index for freshly read zone data."""
+        zone_data["name"] = zone_data["name"] or f"Zone {zone_idx}"
+        zone_data["zone_index"] = zone_idx
+        _LOGGER.debug(
+            "_fetch_device_data_once: Zone %d data: name=%s, speed=%s, mode=%s, time_profile=%s",
+            zone_idx,
+            zone_data["name"],
+            zone_data["speed"],
+            zone_data["mode"],
+            zone_data["time_profile"],
+        )
+        return zone_data
+
+    def _mark_fetch_success(self) -> None:
+        """Clear the backoff and mark the data fresh after a real fetch."""
+        self._reset_backoff()
+        self._last_fetch_monotonic = time.monotonic()
+
+    def _reset_backoff(self) -> None:
+        """Clear the failure backoff after a successful fetch."""
+        self._consecutive_failures = 0
+        self._next_retry_at = 0.0
+
+    def _get_device_cached(self):
+        """
+        Return the device object, reusing it for DEVICE_CACHE_TTL seconds.
+
+        :return: Device object or None
+        """
+        now = time.monotonic()
+        if self._cached_device is not None and now < self._cached_device_expiry:
+            return self._cached_device
+
+        device = self.api_client.get_device(self.device_id, skip_fetch=True)
+        if device is not None:
+            self._cached_device = device
+            self._cached_device_expiry = now + DEVICE_CACHE_TTL
+        return device
+
+    def _invalidate_device_cache(self) -> None:
+        """Drop the cached device object (after reconnects/auth failures)."""
+        self._cached_device = None
+        self._cached_device_expiry = 0.0
+
+    async def _async_refresh_after_change(self) -> None:
+        """
+        Request a refresh after a successful change.
+
+        Goes through the coordinator's debouncer, so a burst of changes
+        (and the entities' own async_request_refresh calls) results in a
+        single poll once the burst is over.
+        """
+        # A successful push proves the API is reachable again
+        self._reset_backoff()
+        # The snapshot no longer reflects the device, always refresh
+        self._last_fetch_monotonic = 0.0
+        await self.async_request_refresh()
+
+    @callback
+    def _apply_optimistic_writes(
+        self, writes: list[tuple[int | None, str, Any]], results: list[bool]
+    ) -> None:
+        """
+        Write the successfully pushed values of a batch into the cached data.
+
+        Entities update right away (one listener update per batch); the
+        debounced refresh afterwards replaces the snapshot with what the
+        device reports.
+        """
+        if not self.data:
+            return
+        changed = False
+        for (zone_idx, property_name, value), ok in zip(writes, results):
+            if not ok:
+                continue
+            if zone_idx is None:
+                target = self.data["system"]
+                key = property_name
+            else:
+                target = self.data["zones"].get(zone_idx)
+                key = _ZONE_KEY_BY_PROPERTY.get(property_name, property_name)
+            if target is None or key not in target:
+                continue
+            target[key] = value
+            changed = True
+        if changed:
+            self.async_update_listeners()
+
+    def device_info(self, zone_idx: int | None) -> DeviceInfo:
+        """
+        Return the shared DeviceInfo of a zone or of the system.
+
+        Rebuilt only when the zone name (or system type/firmware/ID) changes.
+
+        :param zone_idx: Zone index, or None for the system device
+        :return: DeviceInfo built from the current data
+        """
+        if zone_idx:
+            zone_name = self.data["zones"][zone_idx]["name"]
+            key = zone_name
+        else:
+            system_data = self.data["system"]
+            system_type = system_data.get("system_type", "SmartControl")
+            fw_version = system_data.get("fw_version", "Unknown")
+            serial_number = system_data.get("system_id", self.device_id)
+            key = (system_type, fw_version, serial_number)
+
+        cached = self._device_info_cache.get(zone_idx)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if zone_idx:
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, f"{self.device_id}_zone_{zone_idx}")},
+                name=zone_name,
+                manufacturer=MANUFACTURER,
+                model="SmartControl Zone",
+                via_device=(DOMAIN, self.device_id),
+            )
+        else:
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.device_id)},
+                name=f"getAir {system_type}",
+                manufacturer=MANUFACTURER,
+                model=system_type,
+                sw_version=fw_version,
+                serial_number=serial_number,
+            )
+        self._device_info_cache[zone_idx] = (key, device_info)
+        return device_info
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Stamp the update time, then notify the entities."""
+        self.now_unix = int(time.time())
+        super().async_update_listeners()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh unless the current snapshot is still fresh."""
+        if time.monotonic() - self._last_fetch_monotonic < MIN_REFRESH_INTERVAL:
+            _LOGGER.debug("async_request_refresh: Data is still fresh, skipping refresh")
+            return
+        await super().async_request_refresh()
+
+    def _reconnect_sync(self) -> bool:
+        """Reconnect the API client (blocking, runs in executor)."""
+        # The API drops its device objects on reconnect, so do we
+        self._invalidate_device_cache()
+
+        # Reset the reconnect flag in the API if it exists
+        self._reset_reconnect_flag()
+
+        if not self.api_client.connect():
+            return False
+
+        # Reset reconnect flag again after our connect
+        self._reset_reconnect_flag()
+        return True
+
+    def _reset_reconnect_flag(self) -> None:
+        """Clear api_cc1's _reconnect_in_progress flag, if the API has one."""
+        api = getattr(self.api_client, '_api', None)
+        if api is not None and hasattr(api, '_reconnect_in_progress'):
+            api._reconnect_in_progress = False
+            _LOGGER.debug("_reset_reconnect_flag: Reset _reconnect_in_progress flag")
+
+    def _describe_fetch_failure(self) -> str:
+        """Collect details on why fetching failed (runs in executor)."""
+        error_details = []
+
+        # Check if API client is still connected
+        if hasattr(self.api_client, '_api') and self.api_client._api:
+            token_status = getattr(self.api_client._api, '_api_token', None)
+            error_details.append(f"API token present: {token_status is not None}")
+        else:
+            error_details.append("API client has no _api object")
+
+        device = self._get_device_cached()
+        if device is not None:
+            # Check device internal state
+            if hasattr(device, '_api'):
+                error_details.append(f"Device has _api: {device._api is not None}")
+
+            if hasattr(device, '_last_error'):
+                error_details.append(f"Device last error: {device._last_error}")
+
+            # Try to get HTTP response status if available
+            if hasattr(device, '_last_response'):
+                error_details.append(f"Last response: {device._last_response}")
+
+        return ", ".join(error_details) if error_details else "No additional info available"
+
+    def _fetch_device_data_once(self) -> Dict[str, Any] | None:
+        """
+        Fetch device data from the API once (runs in executor, never sleeps).
+
+        :return: Dictionary with system and zone data, or None if the fetch failed
+        :raises ConfigEntryAuthFailed: If the client is disconnected and reconnecting fails
         """
-        _LOGGER.debug("_fetch_device_data: Starting for device %s", self.device_id)
+        _LOGGER.debug("_fetch_device_data_once: Starting for device %s", self.device_id)
+
+        # Check API connection status, reconnect in the same executor hop
+        if not self.api_client.is_connected():
+            _LOGGER.warning("API client not connected, attempting reconnection...")
+            self._invalidate_device_cache()
+            if not self.api_client.connect():
+                _LOGGER.error("Failed to reconnect to API")
+                raise ConfigEntryAuthFailed("API authentication failed - reconnection unsuccessful")
+            _LOGGER.info("Successfully reconnected to API")
 
         try:
             # Ensure credentials file exists (important for api_cc1 token refresh)
             if not self.api_client.ensure_credentials_file():
-                _LOGGER.error("_fetch_device_data: Failed to ensure credentials file exists")
+                _LOGGER.error("_fetch_device_data_once: Failed to ensure credentials file exists")
                 raise UpdateFailed("Credentials file could not be created or accessed")
 
             # Get device object
-            _LOGGER.debug("_fetch_device_data: Getting device object...")
-            device = self.api_client.get_device(self.device_id, skip_fetch=True)
+            _LOGGER.debug("_fetch_device_data_once: Getting device object...")
+            device = self._get_device_cached()
 
             if not device:
-                _LOGGER.error("_fetch_device_data: get_device returned None for device %s", self.device_id)
+                _LOGGER.error("_fetch_device_data_once: get_device returned None for device %s", self.device_id)
                 raise UpdateFailed("Could not get device from API - device object is None")
 
-            _LOGGER.debug("_fetch_device_data: Device object obtained: %s", type(device).__name__)
+            _LOGGER.debug("_fetch_device_data_once: Device object obtained: %s", type(device).__name__)
 
             # Log available device methods for debugging
-            self._log_device_methods(device)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                self._log_device_methods(device)
 
             # Fetch latest data from API
-            _LOGGER.debug("_fetch_device_data: Calling device.fetch()...")
-
-            # Log device state before fetch
-            try:
-                _LOGGER.debug(
-                    "_fetch_device_data: Device state before fetch - "
-                    "device_id: %s, has _api: %s, has _system: %s",
-                    getattr(device, 'device_id', 'N/A'),
-                    hasattr(device, '_api'),
-                    hasattr(device, '_system')
-                )
-            except Exception as debug_err:
-                _LOGGER.debug("_fetch_device_data: Could not read device state: %s", debug_err)
+            _LOGGER.debug("_fetch_device_data_once: Calling device.fetch()...")
 
             try:
-                # CRITICAL: First fetch after connect() often fails with 401
-                # Always try twice to handle token activation delay
                 fetch_result = device.fetch()
-                _LOGGER.debug("_fetch_device_data: device.fetch() returned: %s (attempt 1/2)", fetch_result)
-
-                if not fetch_result:
-                    _LOGGER.info("_fetch_device_data: First fetch failed, retrying immediately (token may need time to activate)...")
-                    
-                    # Short wait for token to become active
-                    import time
-                    time.sleep(0.3)
-                    
-                    # Second attempt - this usually succeeds
-                    fetch_result = device.fetch()
-                    _LOGGER.debug("_fetch_device_data: device.fetch() returned: %s (attempt 2/2)", fetch_result)
-                    
-                    if fetch_result:
-                        _LOGGER.info("_fetch_device_data: Second fetch succeeded!")
+                _LOGGER.debug("_fetch_device_data_once: device.fetch() returned: %s", fetch_result)
 
                 if not fetch_result:
-                    # Both immediate attempts failed - now try reconnect
-                    _LOGGER.warning(
-                        "_fetch_device_data: Both initial fetch attempts failed. Attempting reconnection..."
-                    )
-
-                    # Reset the reconnect flag in the API if it exists
-                    if hasattr(self.api_client._api, '_reconnect_in_progress'):
-                        self.api_client._api._reconnect_in_progress = False
-                        _LOGGER.debug("_fetch_device_data: Reset _reconnect_in_progress flag")
-
-                    # Try to reconnect
-                    if self.api_client.connect():
-                        _LOGGER.info("_fetch_device_data: Reconnection successful, waiting for token to become active...")
-
-                        # CRITICAL: Wait for the token to propagate
-                        import time
-                        time.sleep(0.5)
-
-                        # Reset reconnect flag again after our connect
-                        if hasattr(self.api_client._api, '_reconnect_in_progress'):
-                            self.api_client._api._reconnect_in_progress = False
-
-                        # Try multiple times with delays - matches what status_abfragen.py does
-                        max_retries = 3
-                        for retry_attempt in range(max_retries):
-                            _LOGGER.debug(
-                                "_fetch_device_data: Retry attempt %d/%d...",
-                                retry_attempt + 1,
-                                max_retries
-                            )
-
-                            # Get fresh device object
-                            device = self.api_client.get_device(self.device_id, skip_fetch=True)
-                            if not device:
-                                _LOGGER.error("_fetch_device_data: Could not get device on retry %d", retry_attempt + 1)
-                                continue
-
-                            _LOGGER.debug("_fetch_device_data: Attempting fetch (retry %d/%d)...", retry_attempt + 1, max_retries)
-                            fetch_result = device.fetch()
-                            _LOGGER.debug(
-                                "_fetch_device_data: Retry %d fetch returned: %s",
-                                retry_attempt + 1,
-                                fetch_result
-                            )
-
-                            if fetch_result:
-                                _LOGGER.info("_fetch_device_data: Fetch successful on retry %d", retry_attempt + 1)
-                                break
-
-                            # If not the last retry, wait before trying again
-                            if retry_attempt < max_retries - 1:
-                                wait_time = 0.5
-                                _LOGGER.debug("_fetch_device_data: Waiting %s seconds before next retry...", wait_time)
-                                time.sleep(wait_time)
-
-                        if not fetch_result:
-                            _LOGGER.error("_fetch_device_data: All %d retry attempts failed", max_retries)
-                    else:
-                        _LOGGER.error("_fetch_device_data: Reconnection failed")
-
-                    # If still failing after retry
-                    if not fetch_result:
-                        # Try to get more information about why fetch failed
-                        error_details = []
-
-                        # Check if API client is still connected
-                        if hasattr(self.api_client, '_api') and self.api_client._api:
-                            token_status = getattr(self.api_client._api, '_api_token', None)
-                            error_details.append(f"API token present: {token_status is not None}")
-                        else:
-                            error_details.append("API client has no _api object")
-
-                        # Check device internal state
-                        if hasattr(device, '_api'):
-                            error_details.append(f"Device has _api: {device._api is not None}")
+                    return None
 
-                        if hasattr(device, '_last_error'):
-                            error_details.append(f"Device last error: {device._last_error}")
-
-                        # Try to get HTTP response status if available
-                        if hasattr(device, '_last_response'):
-                            error_details.append(f"Last response: {device._last_response}")
-
-                        error_info = ", ".join(error_details) if error_details else "No additional info available"
-
-                        _LOGGER.warning(
-                            "_fetch_device_data: device.fetch() failed for device %s after retry. "
-                            "Details: %s. "
-                            "Returning cached data to keep polling alive. "
-                            "This could indicate: authentication issues, network problems, "
-                            "or device not responding.",
-                            self.device_id,
-                            error_info
-                        )
-                        
-                        # CRITICAL: Return cached data instead of raising exception!
-                        # This prevents the coordinator from stopping polling due to backoff
-                        if self.data:
-                            _LOGGER.info("_fetch_device_data: Returning cached data to keep coordinator polling")
-                            return self.data
-                        else:
-                            # First update ever failed - we have to raise
-                            _LOGGER.error("_fetch_device_data: No cached data available, raising exception")
-                            raise UpdateFailed(f"First fetch failed - no cached data available. {error_info}")
-
-
-            except UpdateFailed:
-                raise
             except Exception as fetch_exception:
+                # Don't keep reusing a device handle that just raised
+                self._invalidate_device_cache()
                 _LOGGER.warning(
-                    "_fetch_device_data: Exception during device.fetch(): %s (type: %s). "
-                    "Returning cached data to keep polling alive.",
+                    "_fetch_device_data_once: Exception during device.fetch(): %s (type: %s)",
                     fetch_exception,
                     type(fetch_exception).__name__,
                     exc_info=True
                 )
-                # CRITICAL: Return cached data instead of raising exception
-                if self.data:
-                    _LOGGER.info("_fetch_device_data: Returning cached data after fetch exception")
-                    return self.data
-                else:
-                    # First update ever - have to raise
-                    _LOGGER.error("_fetch_device_data: No cached data, raising UpdateFailed")
-                    raise UpdateFailed(f"Exception during device.fetch(): {fetch_exception}")
-
+                # Counts as a failed attempt; _fetch_with_retries decides
+                # whether to fall back to cached data
+                return None
 
-            _LOGGER.debug("_fetch_device_data: Successfully fetched data, compiling system info...")
+            _LOGGER.debug("_fetch_device_data_once: Successfully fetched data, compiling system info...")
 
             # Compile system data
             try:
                 # Convert boot_time Unix timestamp to ISO format datetime with local timezone
                 boot_time_unix = getattr(device, 'boot_time', None)
                 boot_time_str = None
-                if boot_time_unix:
+                if boot_time_unix and boot_time_unix == self._boot_time_cache[0]:
+                    # Only changes on device reboot, reuse the formatted value
+                    boot_time_str = self._boot_time_cache[1]
+                elif boot_time_unix:
                     try:
                         import homeassistant.util.dt as dt_util
                         boot_datetime = datetime.fromtimestamp(
@@ -297,6 +652,7 @@ class GetAirCoordinator(DataUpdateCoordinator):
                     except (ValueError, OSError, OverflowError) as e:
                         _LOGGER.warning("Could not convert boot_time: %s", e)
                         boot_time_str = str(boot_time_unix)
+                    self._boot_time_cache = (boot_time_unix, boot_time_str)
 
                 # Convert notify_time Unix timestamp to ISO format datetime with local timezone
                 notify_time_unix = getattr(device._system, 'notify_time', None)
@@ -314,48 +670,39 @@ class GetAirCoordinator(DataUpdateCoordinator):
 
                 # Compile all system information
                 import homeassistant.util.dt as dt_util
-                system_data = {
-                    "system_id": device.device_id,
-                    "system_type": device.system_type,
-                    "system_type_name": getattr(device, 'system_type_name', device.system_type),
-                    "system_version": getattr(device, 'system_version', ""),
-                    "fw_version": device.fw_app_version_str,
-                    "fw_app_version": getattr(device, 'fw_app_version', 0),
-                    "air_quality": device.air_quality,
-                    "air_pressure": device.air_pressure,
-                    "humidity": device.indoor_humidity,
-                    "temperature": device.indoor_temperature,
-                    "runtime": device._system.runtime,
-                    "boot_time": boot_time_str,
-                    "iaq_accuracy": getattr(device._system, 'iaq_accuracy', None),
-                    "num_zones": getattr(device._system, 'num_zones', 3),
-                    "modelock": getattr(device._system, 'modelock', False),
-                    "notification": getattr(device._system, 'notification', ""),
-                    "notify_time": notify_time_str,
-                    "supports_auto_update": getattr(device._system, 'supports_auto_update', False),
-                    "auto_update_enabled": getattr(device._system, 'auto_update_enabled', False),
-                    "last_update": datetime.now(tz=dt_util.DEFAULT_TIME_ZONE).isoformat(),
-                    "connection_status": "online",
-                }
+                system_data = dict(zip(_DEVICE_KEYS, _DEVICE_FIELDS(device)))
+                system_data.update(
+                    system_type_name=getattr(device, 'system_type_name', system_data["system_type"]),
+                    system_version=getattr(device, 'system_version', ""),
+                    fw_app_version=getattr(device, 'fw_app_version', 0),
+                    boot_time=boot_time_str,
+                    notify_time=notify_time_str,
+                    last_update=datetime.now(tz=dt_util.DEFAULT_TIME_ZONE).isoformat(),
+                    connection_status="online",
+                )
+                # _System is a plain attribute holder, read its __dict__ directly
+                system_attrs = vars(device._system)
+                for field, default in _SYSTEM_FIELDS:
+                    system_data[field] = system_attrs.get(field, default)
 
                 # Add time profiles info using the correct API methods
-                _LOGGER.debug("_fetch_device_data: Fetching time profile names...")
-                for i in range(1, 11):
-                    profile_name_key = f"time_profile_{i}_name"
-                    profile_data_key = f"time_profile_{i}_data"
-
+                _LOGGER.debug("_fetch_device_data_once: Fetching time profile names...")
+                # Resolve the accessor methods once, not per profile
+                get_profile_name = getattr(device, 'get_time_profile_name', None)
+                get_profile_data = getattr(device, 'get_time_profile_data', None)
+                for i, profile_name_key, profile_data_key in _PROFILE_KEYS:
                     try:
                         # Use the get_time_profile_name method instead of getattr
-                        if hasattr(device, 'get_time_profile_name'):
-                            profile_name = device.get_time_profile_name(i)
-                            _LOGGER.debug("_fetch_device_data: Profile %d name: '%s'", i, profile_name)
+                        if get_profile_name is not None:
+                            profile_name = get_profile_name(i)
+                            _LOGGER.debug("_fetch_device_data_once: Profile %d name: '%s'", i, profile_name)
                         else:
                             # Fallback to getattr if method doesn't exist
                             profile_name = getattr(device, profile_name_key, "")
                         
                         # Use the get_time_profile_data method if available
-                        if hasattr(device, 'get_time_profile_data'):
-                            profile_data = device.get_time_profile_data(i)
+                        if get_profile_data is not None:
+                            profile_data = get_profile_data(i)
                         else:
                             profile_data = getattr(device, profile_data_key, None)
 
@@ -363,7 +710,7 @@ class GetAirCoordinator(DataUpdateCoordinator):
                         system_data[profile_data_key] = profile_data
 
                     except Exception as profile_err:
-                        _LOGGER.debug("_fetch_device_data: Could not get profile %d: %s", i, profile_err)
+                        _LOGGER.debug("_fetch_device_data_once: Could not get profile %d: %s", i, profile_err)
                         system_data[profile_name_key] = ""
                         system_data[profile_data_key] = None
 
@@ -371,90 +718,81 @@ class GetAirCoordinator(DataUpdateCoordinator):
                     "system": system_data,
                     "zones": {},
                 }
-                _LOGGER.debug("_fetch_device_data: System data compiled successfully")
+                _LOGGER.debug("_fetch_device_data_once: System data compiled successfully")
             except AttributeError as attr_err:
                 _LOGGER.warning(
-                    "_fetch_device_data: Missing attribute while accessing system data: %s. "
-                    "This may indicate API changes. Returning cached data. "
-                    "Available attributes: %s",
+                    "_fetch_device_data_once: Missing attribute while accessing system data: %s. "
+                    "This may indicate API changes.",
                     attr_err,
-                    dir(device),
                 )
-                # Try to return cached data
-                if self.data:
-                    _LOGGER.info("_fetch_device_data: Returning cached data after AttributeError")
-                    return self.data
-                else:
-                    _LOGGER.error("_fetch_device_data: No cached data, raising UpdateFailed")
-                    raise UpdateFailed(f"Device object missing required attributes: {attr_err}")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "_fetch_device_data_once: Available attributes: %s", dir(device)
+                    )
+                # Failed attempt; the retry wrapper falls back to cached data
+                return None
 
 
             # Fetch data for each zone
-            _LOGGER.debug("_fetch_device_data: Fetching data for zones 1-3...")
-            for zone_idx in range(1, 4):
-                try:
-                    _LOGGER.debug("_fetch_device_data: Selecting zone %d...", zone_idx)
-                    device.select_zone(zone_idx)
+            _LOGGER.debug("_fetch_device_data_once: Fetching data for zones 1-3...")
+            # select_zone() only switches a local index; read the zone objects
+            # directly when the device exposes them, else go through properties
+            zones_snapshot = getattr(device, '_zones', None)
+            if zones_snapshot is not None and not self._zone_schema_validated:
+                # Check the zone container shape once instead of guarding
+                # every poll's reads with try/except
+                self._zone_schema_validated = all(
+                    zone_idx in zones_snapshot for zone_idx in range(1, 4)
+                )
 
-                    zone_data = {
-                        "name": device.name or f"Zone {zone_idx}",
-                        "speed": device.speed,
-                        "mode": device.mode,
-                        "temperature": device.temperature,
-                        "humidity": device.humidity,
-                        "outdoor_temp": device.outdoor_temperature,
-                        "outdoor_humidity": device.outdoor_humidity,
-                        "runtime": device.runtime,
-                        "last_filter_change": device.last_filter_change,
-                        "target_temp": getattr(device, 'target_temp', None),
-                        "target_hmdty_level": getattr(device, 'target_hmdty_level', None),
-                        "auto_mode_voc": getattr(device, 'auto_mode_voc', False),
-                        "auto_mode_silent": getattr(device, 'auto_mode_silent', False),
-                        "mode_deadline": getattr(device, 'mode_deadline', 0),
-                        "time_profile": getattr(device, 'active_time_profile', 0),
-                        "zone_index": zone_idx,
-                    }
-                    data["zones"][zone_idx] = zone_data
-                    _LOGGER.debug(
-                        "_fetch_device_data: Zone %d data: name=%s, speed=%s, mode=%s, time_profile=%s",
+            if zones_snapshot is not None and self._zone_schema_validated:
+                for zone_idx in range(1, 4):
+                    zone = zones_snapshot[zone_idx]
+                    data["zones"][zone_idx] = self._finish_zone_data(
                         zone_idx,
-                        zone_data["name"],
-                        zone_data["speed"],
-                        zone_data["mode"],
-                        zone_data["time_profile"],
+                        {
+                            key: getattr(zone, zone_attr, default)
+                            for key, zone_attr, _, default in _ZONE_FIELDS
+                        },
                     )
-                except Exception as zone_err:
-                    _LOGGER.warning(
-                        "_fetch_device_data: Error fetching zone %d data: %s. Skipping zone.",
-                        zone_idx,
-                        zone_err,
-                    )
-                    # Still add the zone with minimal data
-                    data["zones"][zone_idx] = {
-                        "name": f"Zone {zone_idx}",
-                        "zone_index": zone_idx,
-                    }
+            else:
+                for zone_idx in range(1, 4):
+                    try:
+                        _LOGGER.debug("_fetch_device_data_once: Selecting zone %d...", zone_idx)
+                        device.select_zone(zone_idx)
+                        data["zones"][zone_idx] = self._finish_zone_data(
+                            zone_idx,
+                            {
+                                key: getattr(device, device_attr, default)
+                                for key, _, device_attr, default in _ZONE_FIELDS
+                            },
+                        )
+                    except Exception as zone_err:
+                        _LOGGER.warning(
+                            "_fetch_device_data_once: Error fetching zone %d data: %s. Skipping zone.",
+                            zone_idx,
+                            zone_err,
+                        )
+                        # Still add the zone with minimal data
+                        data["zones"][zone_idx] = {
+                            "name": f"Zone {zone_idx}",
+                            "zone_index": zone_idx,
+                        }
 
-            _LOGGER.debug("_fetch_device_data: Completed successfully")
+            _LOGGER.debug("_fetch_device_data_once: Completed successfully")
             return data
 
         except UpdateFailed:
             raise
         except Exception as err:
             _LOGGER.warning(
-                "_fetch_device_data: Unexpected error: %s (type: %s). "
-                "Returning cached data to keep polling alive.",
+                "_fetch_device_data_once: Unexpected error: %s (type: %s)",
                 err,
                 type(err).__name__,
                 exc_info=True
             )
-            # CRITICAL: Return cached data to prevent polling stop
-            if self.data:
-                _LOGGER.info("_fetch_device_data: Returning cached data after unexpected error")
-                return self.data
-            else:
-                _LOGGER.error("_fetch_device_data: No cached data, raising UpdateFailed")
-                raise UpdateFailed(f"Unexpected error fetching device data: {err}")
+            # Failed attempt; the retry wrapper falls back to cached data
+            return None
 
 
     async def async_set_zone_speed(self, zone_idx: int, speed: float) -> bool:
@@ -468,16 +806,10 @@ class GetAirCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("async_set_zone_speed: Setting zone %d to speed %s", zone_idx, speed)
 
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._set_zone_speed_sync, zone_idx, speed
-            )
+            result = await self._async_queue_write(zone_idx, "speed", speed)
 
             if result:
                 _LOGGER.info("Successfully set zone %d speed to %s", zone_idx, speed)
-                # CRITICAL: Update coordinator data immediately after successful change
-                # The _sync method already did fetch() internally, now update our cache
-                await self._async_update_data_after_change()
             else:
                 _LOGGER.error("Failed to set zone %d speed to %s", zone_idx, speed)
 
@@ -487,54 +819,6 @@ class GetAirCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Error setting zone %d speed: %s", zone_idx, err)
             return False
 
-    def _set_zone_speed_sync(self, zone_idx: int, speed: float) -> bool:
-        """Set zone speed (synchronous, runs in executor)."""
-        _LOGGER.debug("_set_zone_speed_sync: Starting for zone %d, speed %s", zone_idx, speed)
-
-        try:
-            device = self.api_client.get_device(self.device_id, skip_fetch=True)
-
-            if not device:
-                _LOGGER.error("_set_zone_speed_sync: get_device returned None")
-                return False
-
-            # CRITICAL: Fetch current state BEFORE modifying
-            _LOGGER.debug("_set_zone_speed_sync: Fetching current state first...")
-            fetch_before = device.fetch()
-            if not fetch_before:
-                _LOGGER.warning("_set_zone_speed_sync: fetch() before returned False, continuing anyway...")
-
-            _LOGGER.debug("_set_zone_speed_sync: Setting AUTOSET=False")
-            device.AUTOSET = False
-
-            _LOGGER.debug("_set_zone_speed_sync: Selecting zone %d", zone_idx)
-            device.select_zone(zone_idx)
-
-            _LOGGER.debug("_set_zone_speed_sync: Setting speed to %s", speed)
-            device.speed = speed
-
-            _LOGGER.debug("_set_zone_speed_sync: Pushing changes...")
-            push_result = device.push()
-            _LOGGER.debug("_set_zone_speed_sync: Push result: %s", push_result)
-
-            if not push_result:
-                _LOGGER.error("_set_zone_speed_sync: Push failed!")
-                return False
-
-            # CRITICAL: Fetch IMMEDIATELY after push to get updated state
-            _LOGGER.debug("_set_zone_speed_sync: Fetching new state after push...")
-            fetch_after = device.fetch()
-            if fetch_after:
-                _LOGGER.debug("_set_zone_speed_sync: Successfully fetched new state")
-            else:
-                _LOGGER.warning("_set_zone_speed_sync: fetch() after push returned False")
-
-            return True
-
-        except Exception as err:
-            _LOGGER.exception("_set_zone_speed_sync: Error: %s", err)
-            return False
-
     async def async_set_zone_mode(self, zone_idx: int, mode: str) -> bool:
         """
         Set the mode for a zone.
@@ -546,14 +830,10 @@ class GetAirCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("async_set_zone_mode: Setting zone %d to mode %s", zone_idx, mode)
 
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._set_zone_mode_sync, zone_idx, mode
-            )
+            result = await self._async_queue_write(zone_idx, "mode", mode)
 
             if result:
                 _LOGGER.info("Successfully set zone %d mode to %s", zone_idx, mode)
-                await self._async_update_data_after_change()
             else:
                 _LOGGER.error("Failed to set zone %d mode to %s", zone_idx, mode)
 
@@ -563,54 +843,6 @@ class GetAirCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Error setting zone %d mode: %s", zone_idx, err)
             return False
 
-    def _set_zone_mode_sync(self, zone_idx: int, mode: str) -> bool:
-        """Set zone mode (synchronous, runs in executor)."""
-        _LOGGER.debug("_set_zone_mode_sync: Starting for zone %d, mode %s", zone_idx, mode)
-
-        try:
-            device = self.api_client.get_device(self.device_id, skip_fetch=True)
-
-            if not device:
-                _LOGGER.error("_set_zone_mode_sync: get_device returned None")
-                return False
-
-            # CRITICAL: Fetch current state BEFORE modifying
-            _LOGGER.debug("_set_zone_mode_sync: Fetching current state first...")
-            fetch_before = device.fetch()
-            if not fetch_before:
-                _LOGGER.warning("_set_zone_mode_sync: fetch() before returned False, continuing anyway...")
-
-            _LOGGER.debug("_set_zone_mode_sync: Setting AUTOSET=False")
-            device.AUTOSET = False
-
-            _LOGGER.debug("_set_zone_mode_sync: Selecting zone %d", zone_idx)
-            device.select_zone(zone_idx)
-
-            _LOGGER.debug("_set_zone_mode_sync: Setting mode to %s", mode)
-            device.mode = mode
-
-            _LOGGER.debug("_set_zone_mode_sync: Pushing changes...")
-            push_result = device.push()
-            _LOGGER.debug("_set_zone_mode_sync: Push result: %s", push_result)
-
-            if not push_result:
-                _LOGGER.error("_set_zone_mode_sync: Push failed!")
-                return False
-
-            # CRITICAL: Fetch IMMEDIATELY after push to get updated state
-            _LOGGER.debug("_set_zone_mode_sync: Fetching new state after push...")
-            fetch_after = device.fetch()
-            if fetch_after:
-                _LOGGER.debug("_set_zone_mode_sync: Successfully fetched new state")
-            else:
-                _LOGGER.warning("_set_zone_mode_sync: fetch() after push returned False")
-
-            return True
-
-        except Exception as err:
-            _LOGGER.exception("_set_zone_mode_sync: Error: %s", err)
-            return False
-
     async def async_set_zone_property(self, zone_idx: int, property_name: str, value: Any) -> bool:
         """
         Set a generic zone property (e.g., time_profile, target_hmdty_level).
@@ -628,14 +860,10 @@ class GetAirCoordinator(DataUpdateCoordinator):
         )
 
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._set_zone_property_sync, zone_idx, property_name, value
-            )
+            result = await self._async_queue_write(zone_idx, property_name, value)
 
             if result:
                 _LOGGER.info("Successfully set zone %d %s to %s", zone_idx, property_name, value)
-                await self._async_update_data_after_change()
             else:
                 _LOGGER.error("Failed to set zone %d %s to %s", zone_idx, property_name, value)
 
@@ -645,67 +873,6 @@ class GetAirCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Error setting zone %d property %s: %s", zone_idx, property_name, err)
             return False
 
-    def _set_zone_property_sync(self, zone_idx: int, property_name: str, value: Any) -> bool:
-        """Set a generic zone property synchronously (runs in executor)."""
-        _LOGGER.debug(
-            "_set_zone_property_sync: Starting for zone %d, property %s = %s",
-            zone_idx,
-            property_name,
-            value,
-        )
-
-        try:
-            device = self.api_client.get_device(self.device_id, skip_fetch=True)
-
-            if not device:
-                _LOGGER.error("_set_zone_property_sync: get_device returned None")
-                return False
-
-            # CRITICAL: Fetch current state BEFORE modifying
-            _LOGGER.debug("_set_zone_property_sync: Fetching current state first...")
-            fetch_before = device.fetch()
-            if not fetch_before:
-                _LOGGER.warning("_set_zone_property_sync: fetch() before returned False, continuing anyway...")
-
-            _LOGGER.debug("_set_zone_property_sync: Setting AUTOSET=False")
-            device.AUTOSET = False
-
-            _LOGGER.debug("_set_zone_property_sync: Selecting zone %d", zone_idx)
-            device.select_zone(zone_idx)
-
-            # Try setting common attribute names
-            try:
-                setattr(device, property_name, value)
-            except Exception:
-                # fallback: some attributes use active_ prefix
-                try:
-                    setattr(device, f"active_{property_name}", value)
-                except Exception as err:
-                    _LOGGER.error("_set_zone_property_sync: Could not set property %s: %s", property_name, err)
-                    return False
-
-            _LOGGER.debug("_set_zone_property_sync: Pushing changes...")
-            push_result = device.push()
-            _LOGGER.debug("_set_zone_property_sync: Push result: %s", push_result)
-
-            if not push_result:
-                _LOGGER.error("_set_zone_property_sync: Push failed!")
-                return False
-
-            # CRITICAL: Fetch IMMEDIATELY after push to get updated state
-            _LOGGER.debug("_set_zone_property_sync: Fetching new state after push...")
-            fetch_after = device.fetch()
-            if fetch_after:
-                _LOGGER.debug("_set_zone_property_sync: Successfully fetched new state")
-            else:
-                _LOGGER.warning("_set_zone_property_sync: fetch() after push returned False")
-
-            return True
-
-        except Exception as err:
-            _LOGGER.exception("_set_zone_property_sync: Error: %s", err)
-            return False
-
     async def async_set_system_property(self, property_name: str, value: Any) -> bool:
         """
         Set a system-level property on the device.
@@ -716,14 +883,10 @@ class GetAirCoordinator(DataUpdateCoordinator):
         """
         _LOGGER.debug("async_set_system_property: Setting system %s to %s", property_name, value)
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._set_system_property_sync, property_name, value
-            )
+            result = await self._async_queue_write(None, property_name, value)
 
             if result:
                 _LOGGER.info("Successfully set system %s to %s", property_name, value)
-                await self._async_update_data_after_change()
             else:
                 _LOGGER.error("Failed to set system %s to %s", property_name, value)
 
@@ -732,52 +895,195 @@ class GetAirCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Error setting system property %s: %s", property_name, err)
             return False
 
-    def _set_system_property_sync(self, property_name: str, value: Any) -> bool:
-        """Set a system-level property synchronously (runs in executor)."""
-        _LOGGER.debug("_set_system_property_sync: Setting %s = %s", property_name, value)
+    async def _async_queue_write(
+        self, zone_idx: int | None, property_name: str, value: Any
+    ) -> bool:
+        """
+        Queue a property write and wait until it has been pushed.
+
+        Once the batch is pushed, the surviving value of every property is
+        applied to the cached data and a reconciling refresh is requested,
+        so callers don't do either themselves.
+
+        Every write restarts the WRITE_COALESCE_WINDOW timer (capped at
+        WRITE_COALESCE_MAX_DELAY after the first queued write); all writes
+        queued until it fires are sent with a single fetch/push/fetch cycle.
+
+        :param zone_idx: Zone index (1-3), or None for a system property
+        :param property_name: Property name to set on device
+        :param value: Value to set
+        :return: True if the write was applied and pushed successfully
+        """
+        if self._closed:
+            return False
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._pending_writes.append((zone_idx, property_name, value, future))
+        self._schedule_write_flush()
+        return await future
+
+    @callback
+    def _schedule_write_flush(self) -> None:
+        """(Re)start the write window timer."""
+        loop = self.hass.loop
+        now = loop.time()
+        if self._write_window_started is None:
+            self._write_window_started = now
+        delay = min(
+            WRITE_COALESCE_WINDOW,
+            self._write_window_started + WRITE_COALESCE_MAX_DELAY - now,
+        )
+        if self._write_timer is not None:
+            self._write_timer.cancel()
+        self._write_timer = loop.call_later(max(delay, 0), self._start_write_flush)
+
+    @callback
+    def _start_write_flush(self) -> None:
+        """Start pushing queued writes unless a push is already running."""
+        self._write_timer = None
+        self._write_window_started = None
+        # A running flush picks up everything queued meanwhile
+        if self._write_flush_task is None or self._write_flush_task.done():
+            self._write_flush_task = self.hass.async_create_background_task(
+                self._async_flush_writes(), "getair_flush_writes"
+            )
+
+    async def _async_flush_writes(self) -> None:
+        """Push queued writes until the queue is empty."""
+        while self._pending_writes:
+            writes, self._pending_writes = self._pending_writes, []
+            await self._async_push_writes(writes)
+
+    async def _async_push_writes(
+        self, writes: list[tuple[int | None, str, Any, asyncio.Future]]
+    ) -> None:
+        """Push one batch of queued writes and resolve their futures."""
+        # Collapse repeated writes of the same property (e.g. a dragged
+        # slider) to the last value; every caller gets that write's result
+        unique: list[tuple[int | None, str, Any]] = []
+        slot_by_key: dict[tuple[int | None, str], int] = {}
+        slots: list[int] = []
+        for zone_idx, name, value, _ in writes:
+            slot = slot_by_key.get((zone_idx, name))
+            if slot is None:
+                slot = slot_by_key[(zone_idx, name)] = len(unique)
+                unique.append((zone_idx, name, value))
+            else:
+                unique[slot] = (zone_idx, name, value)
+            slots.append(slot)
+
+        if len(unique) < len(writes):
+            _LOGGER.debug(
+                "_async_flush_writes: Coalesced %d writes into %d",
+                len(writes),
+                len(unique),
+            )
+
         try:
-            device = self.api_client.get_device(self.device_id, skip_fetch=True)
+            results = await self._async_add_executor_job(self._push_writes_sync, unique)
+        except asyncio.CancelledError:
+            # Shutdown cancelled the flush; don't leave callers waiting
+            for _, _, _, future in writes:
+                if not future.done():
+                    future.set_result(False)
+            raise
+        except Exception as err:
+            _LOGGER.exception("_async_flush_writes: Error pushing writes: %s", err)
+            results = [False] * len(unique)
+
+        # Only the values actually pushed are shown, once per batch
+        self._apply_optimistic_writes(unique, results)
+
+        for (_, _, _, future), slot in zip(writes, slots):
+            if not future.done():
+                future.set_result(results[slot])
+
+        if any(results):
+            await self._async_refresh_after_change()
+
+    def _push_writes_sync(self, writes: list[tuple[int | None, str, Any]]) -> list[bool]:
+        """
+        Apply a batch of property writes with a single push (runs in executor).
+
+        :param writes: (zone index or None for system, property name, value)
+        :return: Success per write, in the same order
+        """
+        _LOGGER.debug("_push_writes_sync: Applying %d write(s)", len(writes))
+        results = [False] * len(writes)
+
+        try:
+            device = self._get_device_cached()
+
             if not device:
-                _LOGGER.error("_set_system_property_sync: get_device returned None")
-                return False
+                _LOGGER.error("_push_writes_sync: get_device returned None")
+                return results
 
             # CRITICAL: Fetch current state BEFORE modifying
-            _LOGGER.debug("_set_system_property_sync: Fetching current state first...")
+            _LOGGER.debug("_push_writes_sync: Fetching current state first...")
             fetch_before = device.fetch()
             if not fetch_before:
-                _LOGGER.warning("_set_system_property_sync: fetch() before returned False, continuing anyway...")
+                _LOGGER.warning("_push_writes_sync: fetch() before returned False, continuing anyway...")
 
-            try:
-                setattr(device, property_name, value)
-            except Exception as err:
-                _LOGGER.error("_set_system_property_sync: Could not set %s: %s", property_name, err)
-                return False
+            _LOGGER.debug("_push_writes_sync: Setting AUTOSET=False")
+            device.AUTOSET = False
 
+            selected_zone = None
+            for i, (zone_idx, property_name, value) in enumerate(writes):
+                if zone_idx is None:
+                    try:
+                        setattr(device, property_name, value)
+                        results[i] = True
+                    except Exception as err:
+                        _LOGGER.error("_push_writes_sync: Could not set %s: %s", property_name, err)
+                    continue
+
+                if zone_idx != selected_zone:
+                    _LOGGER.debug("_push_writes_sync: Selecting zone %d", zone_idx)
+                    device.select_zone(zone_idx)
+                    selected_zone = zone_idx
+
+                _LOGGER.debug("_push_writes_sync: Setting %s to %s", property_name, value)
+                # Try setting common attribute names
+                try:
+                    setattr(device, property_name, value)
+                    results[i] = True
+                except Exception:
+                    # fallback: some attributes use active_ prefix
+                    try:
+                        setattr(device, f"active_{property_name}", value)
+                        results[i] = True
+                    except Exception as err:
+                        _LOGGER.error("_push_writes_sync: Could not set property %s: %s", property_name, err)
+
+            if not any(results):
+                return results
+
+            _LOGGER.debug("_push_writes_sync: Pushing changes...")
             push_result = device.push()
-            _LOGGER.debug("_set_system_property_sync: Push result: %s", push_result)
-            
+            _LOGGER.debug("_push_writes_sync: Push result: %s", push_result)
+
             if not push_result:
-                _LOGGER.error("_set_system_property_sync: Push failed!")
-                return False
+                _LOGGER.error("_push_writes_sync: Push failed!")
+                return [False] * len(writes)
 
             # CRITICAL: Fetch IMMEDIATELY after push to get updated state
-            _LOGGER.debug("_set_system_property_sync: Fetching new state after push...")
+            _LOGGER.debug("_push_writes_sync: Fetching new state after push...")
             fetch_after = device.fetch()
             if fetch_after:
-                _LOGGER.debug("_set_system_property_sync: Successfully fetched new state")
+                _LOGGER.debug("_push_writes_sync: Successfully fetched new state")
             else:
-                _LOGGER.warning("_set_system_property_sync: fetch() after push returned False")
+                _LOGGER.warning("_push_writes_sync: fetch() after push returned False")
+
+            return results
 
-            return True
         except Exception as err:
-            _LOGGER.exception("_set_system_property_sync: Error: %s", err)
-            return False
+            _LOGGER.exception("_push_writes_sync: Error: %s", err)
+            return [False] * len(writes)
 
     def _log_device_methods(self, device) -> None:
         """Log device methods and attributes for debugging."""
         try:
             # Only log once per coordinator instance to avoid spam
-            if not hasattr(self, '_methods_logged'):
+            if not self._methods_logged:
                 device_methods = [m for m in dir(device) if not m.startswith('_')]
                 _LOGGER.debug(
                     "_log_device_methods: Available public methods/attributes: %s",
@@ -786,30 +1092,3 @@ class GetAirCoordinator(DataUpdateCoordinator):
                 self._methods_logged = True
         except Exception as err:
             _LOGGER.debug("_log_device_methods: Could not log methods: %s", err)
-
-    async def _async_update_data_after_change(self) -> None:
-        """
-        Update coordinator data immediately after a successful change.
-        
-        This method is called after push() + fetch() in the sync methods,
-        so the device object has fresh data. We just need to extract it
-        and update self.data.
-        """
-        try:
-            _LOGGER.debug("_async_update_data_after_change: Updating coordinator data...")
-            
-            # Call _async_update_data which fetches from the device
-            new_data = await self._async_update_data()
-            
-            if new_data:
-                # Update self.data directly (async_set_updated_data would trigger listeners)
-                self.data = new_data
-                # Trigger a state update for all entities
-                self.async_set_updated_data(new_data)
-                _LOGGER.debug("_async_update_data_after_change: Successfully updated data")
-            else:
-                _LOGGER.warning("_async_update_data_after_change: Update returned no data")
-                
-        except Exception as err:
-            _LOGGER.warning("_async_update_data_after_change: Error updating data: %s", err)
-
@@ -1,27 +1,36 @@
 """Datetime entities for getAir SmartControl."""
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, tzinfo
+from functools import lru_cache
 
 from homeassistant.components.datetime import DateTimeEntity, DateTimeEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+import homeassistant.util.dt as dt_util
 
 from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _ts_to_datetime(ts: int, tz: tzinfo) -> datetime:
+    """Convert a Unix timestamp to an aware datetime (deadlines rarely change)."""
+    return datetime.fromtimestamp(ts, tz=tz)
+
+
 @dataclass
 class GetAirDateTimeEntityDescription(DateTimeEntityDescription):
     """Describe getAir datetime entity."""
 
     zone_idx: int | None = None
     data_key: str | None = None
+    key_suffix: str = ""
 
 
 DATETIME_DESCRIPTIONS = []
@@ -31,7 +40,8 @@ for zone_idx in range(1, 4):
     # Mode deadline as datetime picker
     DATETIME_DESCRIPTIONS.append(
         GetAirDateTimeEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_mode_deadline_datetime",
+            key=f"zone_{zone_idx}_mode_deadline_datetime",
+            key_suffix="mode_deadline_datetime",
             translation_key="zone_mode_deadline_datetime_control",
             name="Modus-Deadline (Datum/Uhrzeit)",
             data_key="mode_deadline",
@@ -44,6 +54,12 @@ for zone_idx in range(1, 4):
 class GetAirDateTime(CoordinatorEntity, DateTimeEntity):
     """Representation of a getAir datetime entity."""
 
+    __slots__ = (
+        "_device_id",
+        "_zone_idx",
+        "_zone_name",
+    )
+
     _attr_has_entity_name = False
     entity_description: GetAirDateTimeEntityDescription
 
@@ -58,34 +74,36 @@ class GetAirDateTime(CoordinatorEntity, DateTimeEntity):
         self.entity_description = description
         self._device_id = device_id
         self._zone_idx = description.zone_idx
+
+        # Read by name, kept current by _handle_coordinator_update
+        self._zone_name: str | None = coordinator.data["zones"][self._zone_idx]["name"]
         
         # Build entity_id
-        zone_name = coordinator.data["zones"][self._zone_idx]["name"]
-        zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-        zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
+        zone_name_clean = coordinator.zone_clean_names[self._zone_idx]
         
-        key_with_zone = description.key.replace("{zone_name}", zone_name_clean)
-        self._attr_unique_id = f"getair_{device_id}_{key_with_zone}"
+        self._attr_unique_id = (
+            f"getair_{device_id}_{self._zone_idx}_{zone_name_clean}_{description.key_suffix}"
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up a renamed zone, then write the new state."""
+        data = self.coordinator.data
+        if data:
+            self._zone_name = data["zones"][self._zone_idx]["name"]
+        super()._handle_coordinator_update()
 
     @property
     def name(self) -> str:
         """Return the name of the datetime."""
-        if self.coordinator.data:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} {self.entity_description.name}"
-        return self.entity_description.name
+        if self._zone_name is None:
+            return self.entity_description.name
+        return f"{self._zone_name} {self.entity_description.name}"
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-            name=zone_name,
-            manufacturer=MANUFACTURER,
-            model="SmartControl Zone",
-            via_device=(DOMAIN, self._device_id),
-        )
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
 
     @property
     def native_value(self) -> datetime | None:
@@ -101,8 +119,9 @@ class GetAirDateTime(CoordinatorEntity, DateTimeEntity):
         
         try:
             # Convert Unix timestamp to datetime with Home Assistant's timezone
-            import homeassistant.util.dt as dt_util
-            return datetime.fromtimestamp(int(deadline_unix), tz=dt_util.DEFAULT_TIME_ZONE)
+            # (read on each call and part of the cache key, the configured
+            # time zone can change at runtime)
+            return _ts_to_datetime(int(deadline_unix), dt_util.DEFAULT_TIME_ZONE)
         except (ValueError, TypeError, OSError):
             return None
 
@@ -125,9 +144,9 @@ class GetAirDateTime(CoordinatorEntity, DateTimeEntity):
                 deadline_unix,
             )
             
-            if success:
-                await self.coordinator.async_request_refresh()
-            else:
+            # On success the coordinator has already applied the value to its
+            # data and scheduled the reconciling refresh itself
+            if not success:
                 _LOGGER.error(
                     "Failed to set mode_deadline for zone %s",
                     self._zone_idx,
@@ -147,17 +166,14 @@ async def async_setup_entry(
     """Set up datetime entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
-    entities = []
-
-    for description in DATETIME_DESCRIPTIONS:
+    entities = [
+        GetAirDateTime(coordinator, device_id, description)
+        for description in DATETIME_DESCRIPTIONS
         # Skip zone datetimes if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
-
-        entity = GetAirDateTime(coordinator, device_id, description)
-        entities.append(entity)
+        if description.zone_idx is None or description.zone_idx in enabled_idx
+    ]
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
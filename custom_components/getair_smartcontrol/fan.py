@@ -1,5 +1,6 @@
 """Fan entities for getAir SmartControl."""
 import logging
+from bisect import bisect_left
 from typing import Any
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
@@ -8,19 +9,9 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-"""Fan entities for getAir SmartControl."""
-import logging
-from typing import Any
-
-from homeassistant.components.fan import FanEntity, FanEntityFeature
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .coordinator import GetAirCoordinator, slugify_zone_name
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,10 +31,57 @@ SPEED_TO_PERCENT = {
 # Reverse mapping: percentage -> speed
 PERCENT_TO_SPEED = {v: k for k, v in SPEED_TO_PERCENT.items()}
 
+# Sorted keys for nearest-value lookups
+_SPEED_KEYS = tuple(sorted(SPEED_TO_PERCENT))
+_PERCENT_KEYS = tuple(sorted(PERCENT_TO_SPEED))
+
+
+def _nearest(sorted_keys: tuple, value: float) -> float:
+    """Return the key closest to value (the lower one on a tie)."""
+    i = bisect_left(sorted_keys, value)
+    if i == 0:
+        return sorted_keys[0]
+    if i == len(sorted_keys):
+        return sorted_keys[-1]
+    below, above = sorted_keys[i - 1], sorted_keys[i]
+    return below if value - below <= above - value else above
+
+
+# Speed for every integer percentage 0-100, precomputed with the same
+# nearest-match rule so a set_percentage call is a single tuple index
+_PERCENT_SPEED_TABLE = tuple(
+    PERCENT_TO_SPEED[_nearest(_PERCENT_KEYS, percentage)] for percentage in range(101)
+)
+
+
+# State attribute name -> zone data key, exposed in this order
+_ATTR_MAP: tuple[tuple[str, str], ...] = (
+    ("mode", "mode"),
+    ("temperature", "temperature"),
+    ("humidity", "humidity"),
+    ("target_temperature", "target_temp"),
+    ("target_humidity_level", "target_hmdty_level"),
+    ("outdoor_temperature", "outdoor_temp"),
+    ("outdoor_humidity", "outdoor_humidity"),
+    ("runtime_hours", "runtime"),
+    ("filter_runtime_hours", "last_filter_change"),
+    ("auto_mode_voc", "auto_mode_voc"),
+    ("auto_mode_silent", "auto_mode_silent"),
+    ("active_time_profile", "time_profile"),
+    ("mode_deadline", "mode_deadline"),
+)
+
 
 class GetAirZoneFan(CoordinatorEntity, FanEntity):
     """Representation of a getAir Zone as a Fan entity."""
 
+    __slots__ = (
+        "_device_id",
+        "_zone_idx",
+        "_last_nonzero_percentage",
+        "_zone_name",
+    )
+
     _attr_has_entity_name = False
     _attr_supported_features = FanEntityFeature.SET_SPEED | FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
 
@@ -58,10 +96,13 @@ class GetAirZoneFan(CoordinatorEntity, FanEntity):
         super().__init__(coordinator)
         self._device_id = device_id
         self._zone_idx = zone_idx
+
+        # Read by name, kept current by _handle_coordinator_update
+        zone = coordinator.data["zones"][zone_idx] if coordinator.data else None
+        self._zone_name: str | None = zone["name"] if zone is not None else None
         
         # Build entity_id with getair prefix, device_id, and zone name
-        zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-        zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
+        zone_name_clean = slugify_zone_name(zone_name)
         
         self._attr_unique_id = f"getair_{device_id}_{zone_idx}_{zone_name_clean}_fan"
         self._attr_icon = "mdi:fan"
@@ -69,38 +110,45 @@ class GetAirZoneFan(CoordinatorEntity, FanEntity):
         # Keep last non-zero percentage per entity
         self._last_nonzero_percentage: int | None = None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up a renamed zone, then write the new state."""
+        data = self.coordinator.data
+        if data:
+            self._zone_name = data["zones"][self._zone_idx]["name"]
+        super()._handle_coordinator_update()
+
+    @property
+    def _zone(self) -> dict[str, Any] | None:
+        """Return this zone's coordinator data, or None before the first refresh."""
+        data = self.coordinator.data
+        return data["zones"][self._zone_idx] if data else None
+
     @property
     def name(self) -> str:
         """Return the name of the fan."""
-        if self.coordinator.data:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} Lüfter"
-        return "Lüfter"
+        if self._zone_name is None:
+            return "Lüfter"
+        return f"{self._zone_name} Lüfter"
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-            name=self.coordinator.data["zones"][self._zone_idx]["name"],
-            manufacturer=MANUFACTURER,
-            model="SmartControl Zone",
-            via_device=(DOMAIN, self._device_id),
-        )
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
 
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        if not self.coordinator.data:
+        zone = self._zone
+        if zone is None:
             return None
 
-        speed = self.coordinator.data["zones"][self._zone_idx].get("speed")
+        speed = zone.get("speed")
         if speed is None:
             return None
 
         # Find closest speed key and map to percentage
-        closest_speed = min(SPEED_TO_PERCENT.keys(), key=lambda s: abs(s - speed))
-        return SPEED_TO_PERCENT.get(closest_speed)
+        return SPEED_TO_PERCENT[_nearest(_SPEED_KEYS, speed)]
 
     @property
     def is_on(self) -> bool:
@@ -111,26 +159,12 @@ class GetAirZoneFan(CoordinatorEntity, FanEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
+        zone_data = self._zone
+        if zone_data is None:
             return {}
 
-        zone_data = self.coordinator.data["zones"][self._zone_idx]
-
-        return {
-            "mode": zone_data.get("mode"),
-            "temperature": zone_data.get("temperature"),
-            "humidity": zone_data.get("humidity"),
-            "target_temperature": zone_data.get("target_temp"),
-            "target_humidity_level": zone_data.get("target_hmdty_level"),
-            "outdoor_temperature": zone_data.get("outdoor_temp"),
-            "outdoor_humidity": zone_data.get("outdoor_humidity"),
-            "runtime_hours": zone_data.get("runtime"),
-            "filter_runtime_hours": zone_data.get("last_filter_change"),
-            "auto_mode_voc": zone_data.get("auto_mode_voc"),
-            "auto_mode_silent": zone_data.get("auto_mode_silent"),
-            "active_time_profile": zone_data.get("time_profile"),
-            "mode_deadline": zone_data.get("mode_deadline"),
-        }
+        get = zone_data.get
+        return {attr: get(key) for attr, key in _ATTR_MAP}
 
     async def async_turn_on(
         self,
@@ -156,17 +190,9 @@ class GetAirZoneFan(CoordinatorEntity, FanEntity):
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage."""
-        # If setting to 0, use speed 0.0
-        if percentage == 0:
-            closest_speed = 0.0
-        else:
-            # Find closest percentage and map to speed
-            closest_percent = min(PERCENT_TO_SPEED.keys(), key=lambda x: abs(x - percentage))
-            closest_speed = PERCENT_TO_SPEED.get(closest_percent)
-
-        if closest_speed is None:
-            _LOGGER.error("Invalid percentage: %s", percentage)
-            return
+        # Clamp to 0-100 and map to the closest speed (0 -> 0.0)
+        percentage = 0 if percentage <= 0 else 100 if percentage >= 100 else int(percentage)
+        closest_speed = _PERCENT_SPEED_TABLE[percentage]
 
         # If non-zero, remember as last known speed
         if percentage > 0:
@@ -190,14 +216,20 @@ async def async_setup_entry(
     """Set up fan entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
-    entities = []
+    zone_names = hass.data[DOMAIN][config_entry.entry_id].get("zone_names", {})
 
-    for zone_idx in range(1, 4):
-        if enabled_zones.get(f"zone_{zone_idx}", True):
-            zone_name = hass.data[DOMAIN][config_entry.entry_id].get("zone_names", {}).get(zone_idx, f"Zone {zone_idx}")
-            entity = GetAirZoneFan(coordinator, device_id, zone_idx, zone_name)
-            entities.append(entity)
+    entities = [
+        GetAirZoneFan(
+            coordinator,
+            device_id,
+            zone_idx,
+            zone_names.get(zone_idx, f"Zone {zone_idx}"),
+        )
+        for zone_idx in range(1, 4)
+        if zone_idx in enabled_idx
+    ]
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
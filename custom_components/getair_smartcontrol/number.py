@@ -1,37 +1,43 @@
 """Number entities for getAir SmartControl."""
 import logging
+import time
 from dataclasses import dataclass
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long a computed "remaining minutes" value is reused (seconds)
+REMAINING_MINUTES_CACHE_TTL = 30
 
-@dataclass
+
+@dataclass(frozen=True)
 class GetAirNumberEntityDescription(NumberEntityDescription):
     """Describe getAir number entity."""
 
     zone_idx: int | None = None
     data_key: str | None = None
+    key_suffix: str = ""
 
 
-NUMBER_DESCRIPTIONS = []
+_descriptions: list[GetAirNumberEntityDescription] = []
 
 # Add zone-specific numbers
 for zone_idx in range(1, 4):
     # Target temperature (0x2030)
-    NUMBER_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirNumberEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_target_temp",
+            key=f"zone_{zone_idx}_target_temp",
+            key_suffix="target_temp",
             translation_key="zone_target_temperature_control",
             name="Zieltemperatur",
             data_key="target_temp",
@@ -46,9 +52,10 @@ for zone_idx in range(1, 4):
     )
     
     # Filter runtime reset (0x2006)
-    NUMBER_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirNumberEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_filter_runtime",
+            key=f"zone_{zone_idx}_filter_runtime",
+            key_suffix="filter_runtime",
             translation_key="zone_filter_runtime_control",
             name="Filter-Laufzeit",
             data_key="last_filter_change",
@@ -63,9 +70,10 @@ for zone_idx in range(1, 4):
     )
     
     # Mode deadline (0x2021) - UNIX TIMESTAMP (direkt, für Power-User)
-    NUMBER_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirNumberEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_mode_deadline_unix",
+            key=f"zone_{zone_idx}_mode_deadline_unix",
+            key_suffix="mode_deadline_unix",
             translation_key="zone_mode_deadline_unix_control",
             name="Modus-Deadline (Unix)",
             data_key="mode_deadline",
@@ -80,9 +88,10 @@ for zone_idx in range(1, 4):
     )
     
     # Mode deadline OFFSET (0-120 Minuten ab jetzt, benutzerfreundlich!)
-    NUMBER_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirNumberEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_mode_deadline_offset",
+            key=f"zone_{zone_idx}_mode_deadline_offset",
+            key_suffix="mode_deadline_offset",
             translation_key="zone_mode_deadline_offset_control",
             name="Modus-Dauer (Minuten ab jetzt)",
             data_key="mode_deadline_offset",  # Special handling
@@ -95,10 +104,30 @@ for zone_idx in range(1, 4):
         )
     )
 
+NUMBER_DESCRIPTIONS: tuple[GetAirNumberEntityDescription, ...] = tuple(_descriptions)
+del _descriptions
+
+# Descriptions per zone, so setup only walks the enabled zones
+NUMBER_DESCRIPTIONS_BY_ZONE: dict[int, tuple[GetAirNumberEntityDescription, ...]] = {
+    zone_idx: tuple(d for d in NUMBER_DESCRIPTIONS if d.zone_idx == zone_idx)
+    for zone_idx in range(1, 4)
+}
+
 
 class GetAirNumber(CoordinatorEntity, NumberEntity):
     """Representation of a getAir number."""
 
+    __slots__ = (
+        "_device_id",
+        "_zone_idx",
+        "_data_key",
+        "_zone_name",
+        "_cached_deadline",
+        "_cached_remaining",
+        "_cached_remaining_at",
+        "_converted_value",
+    )
+
     _attr_has_entity_name = False
     entity_description: GetAirNumberEntityDescription
 
@@ -113,86 +142,123 @@ class GetAirNumber(CoordinatorEntity, NumberEntity):
         self.entity_description = description
         self._device_id = device_id
         self._zone_idx = description.zone_idx
+        self._data_key = description.data_key
+
+        # The name is a plain _attr_* value, rebuilt by
+        # _handle_coordinator_update only when the zone is renamed
+        self._zone_name: str = coordinator.data["zones"][self._zone_idx]["name"]
+        self._set_zone_attrs()
+
+        # Last remaining-minutes result for mode_deadline_offset
+        self._cached_deadline = None
+        self._cached_remaining = 0.0
+        self._cached_remaining_at = 0.0
+
+        # Plain properties are converted to float on coordinator updates only
+        self._converted_value: float | None = self._convert_value()
         
         # Build entity_id with getair prefix, device_id, and zone name
-        zone_name = coordinator.data["zones"][self._zone_idx]["name"]
-        zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-        zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
+        zone_name_clean = coordinator.zone_clean_names[self._zone_idx]
         
-        key_with_zone = description.key.replace("{zone_name}", zone_name_clean)
-        self._attr_unique_id = f"getair_{device_id}_{key_with_zone}"
+        self._attr_unique_id = (
+            f"getair_{device_id}_{self._zone_idx}_{zone_name_clean}_{description.key_suffix}"
+        )
 
-    @property
-    def name(self) -> str:
-        """Return the name of the number."""
-        if self.coordinator.data:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} {self.entity_description.name}"
-        return self.entity_description.name
+    def _set_zone_attrs(self) -> None:
+        """Set the name from the current zone name."""
+        self._attr_name = f"{self._zone_name} {self.entity_description.name}"
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-            name=zone_name,
-            manufacturer=MANUFACTURER,
-            model="SmartControl Zone",
-            via_device=(DOMAIN, self._device_id),
-        )
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up a renamed zone, then write the new state."""
+        data = self.coordinator.data
+        if data:
+            zone_name = data["zones"][self._zone_idx]["name"]
+            if zone_name != self._zone_name:
+                self._zone_name = zone_name
+                self._set_zone_attrs()
+        self._converted_value = self._convert_value()
+        super()._handle_coordinator_update()
+
+    def _convert_value(self) -> float | None:
+        """Read this entity's (non-offset) property from the coordinator as float."""
+        data_key = self._data_key
+        if data_key == "mode_deadline_offset" or not self.coordinator.data:
+            return None
+
+        value = self.coordinator.data["zones"].get(self._zone_idx, {}).get(data_key)
+        if value is None:
+            return None
+
+        # Device values are almost always plain floats or ints already
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
+            return float(value)
+
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            _LOGGER.warning(
+                "Could not convert %s value to float: %s",
+                data_key,
+                value,
+            )
+            return None
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
+        # Normal property - converted once per coordinator update
+        if self._data_key != "mode_deadline_offset":
+            return self._converted_value
+
         if not self.coordinator.data:
             return None
 
         zone_data = self.coordinator.data["zones"].get(self._zone_idx, {})
-        data_key = self.entity_description.data_key
-        
-        # Special handling for mode_deadline_offset
-        if data_key == "mode_deadline_offset":
-            # Show remaining minutes until deadline
-            deadline_unix = zone_data.get("mode_deadline")
-            
-            if deadline_unix is None or deadline_unix == 0:
-                return 0  # No deadline set
-            
-            try:
-                import time
-                current_unix = int(time.time())
-                remaining_seconds = int(deadline_unix) - current_unix
-                remaining_minutes = max(0, remaining_seconds // 60)
-                
-                return float(remaining_minutes)
-            except (ValueError, TypeError):
-                return 0
-        
-        # Normal property - read directly
-        value = zone_data.get(data_key)
+
+        # Special handling for mode_deadline_offset: show remaining minutes
+        # until deadline
+        deadline_unix = zone_data.get("mode_deadline")
         
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(
-                    "Could not convert %s value to float: %s",
-                    data_key,
-                    value,
-                )
-                return None
+        if deadline_unix is None or deadline_unix == 0:
+            return 0  # No deadline set
         
-        return None
+        # Reuse the last result while the deadline is unchanged, so
+        # repeated state reads within the TTL return the same value
+        now = time.monotonic()
+        if (
+            deadline_unix == self._cached_deadline
+            and now - self._cached_remaining_at < REMAINING_MINUTES_CACHE_TTL
+        ):
+            return self._cached_remaining
+
+        try:
+            current_unix = int(time.time())
+            remaining_seconds = int(deadline_unix) - current_unix
+            remaining_minutes = float(max(0, remaining_seconds // 60))
+        except (ValueError, TypeError):
+            return 0
+
+        self._cached_deadline = deadline_unix
+        self._cached_remaining = remaining_minutes
+        self._cached_remaining_at = now
+        return remaining_minutes
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value."""
-        data_key = self.entity_description.data_key
+        data_key = self._data_key
         
         # Special handling for mode_deadline_offset
         if data_key == "mode_deadline_offset":
             # User entered minutes from now
-            import time
             current_unix = int(time.time())
             minutes_offset = int(value)
             deadline_unix = current_unix + (minutes_offset * 60)
@@ -224,9 +290,9 @@ class GetAirNumber(CoordinatorEntity, NumberEntity):
                 value,
             )
         
-        if success:
-            await self.coordinator.async_request_refresh()
-        else:
+        # On success the coordinator has already written the value into its
+        # data (entities update right away) and scheduled a debounced refresh
+        if not success:
             _LOGGER.error(
                 "Failed to set %s for zone %s",
                 data_key if data_key != "mode_deadline_offset" else "mode_deadline",
@@ -242,17 +308,13 @@ async def async_setup_entry(
     """Set up number entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
-
-    entities = []
-
-    for description in NUMBER_DESCRIPTIONS:
-        # Skip zone numbers if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
-        entity = GetAirNumber(coordinator, device_id, description)
-        entities.append(entity)
+    entities = [
+        GetAirNumber(coordinator, device_id, description)
+        for zone_idx in sorted(enabled_idx)
+        for description in NUMBER_DESCRIPTIONS_BY_ZONE[zone_idx]
+    ]
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
@@ -4,19 +4,19 @@ from dataclasses import dataclass
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 # Available modes for getAir zones
 # Using German names directly since Home Assistant doesn't translate select options well
-AVAILABLE_MODES = [
+AVAILABLE_MODES = (
     "ventilate",        # API value
     "ventilate_hr",     
     "ventilate_inv",    
@@ -25,7 +25,7 @@ AVAILABLE_MODES = [
     "rush",             
     "rush_hr",          
     "rush_inv",         
-]
+)
 
 # Human-readable mode labels (German)
 MODE_LABELS = {
@@ -46,23 +46,40 @@ HUMIDITY_LEVEL_LABELS = {
     "fifty-seventy": "50-70%",
 }
 
+# Precomputed option lists and label -> API value lookups
+MODE_OPTIONS = [MODE_LABELS[mode] for mode in AVAILABLE_MODES]
+HUMIDITY_OPTIONS = list(HUMIDITY_LEVEL_LABELS.values())
+MODE_LABELS_INV = {label: mode for mode, label in MODE_LABELS.items()}
+HUMIDITY_LEVEL_LABELS_INV = {label: value for value, label in HUMIDITY_LEVEL_LABELS.items()}
 
-@dataclass
+# Label -> API value lookup per static selector data_key
+_OPTION_LOOKUPS = {
+    "mode": MODE_LABELS_INV,
+    "target_hmdty_level": HUMIDITY_LEVEL_LABELS_INV,
+}
+
+# System data keys of the names of time profiles 1-10
+_TIME_PROFILE_KEYS = tuple(f"time_profile_{i}_name" for i in range(1, 11))
+
+
+@dataclass(frozen=True)
 class GetAirSelectEntityDescription(SelectEntityDescription):
     """Describe getAir select entity."""
 
     zone_idx: int | None = None
     data_key: str | None = None
+    key_suffix: str = ""
 
 
-SELECT_DESCRIPTIONS = []
+_descriptions: list[GetAirSelectEntityDescription] = []
 
 # Add zone-specific mode selectors
 for zone_idx in range(1, 4):
     # Operating mode
-    SELECT_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirSelectEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_mode",
+            key=f"zone_{zone_idx}_mode",
+            key_suffix="mode",
             translation_key="zone_mode",
             name="Betriebsmodus",
             zone_idx=zone_idx,
@@ -72,9 +89,10 @@ for zone_idx in range(1, 4):
     )
     
     # Target humidity level (0x2031)
-    SELECT_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirSelectEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_target_humidity",
+            key=f"zone_{zone_idx}_target_humidity",
+            key_suffix="target_humidity",
             translation_key="zone_target_humidity_control",
             name="Ziel-Luftfeuchtigkeit",
             zone_idx=zone_idx,
@@ -84,9 +102,10 @@ for zone_idx in range(1, 4):
     )
     
     # Time profile (0x2050)
-    SELECT_DESCRIPTIONS.append(
+    _descriptions.append(
         GetAirSelectEntityDescription(
-            key=f"{zone_idx}_{{zone_name}}_time_profile",
+            key=f"zone_{zone_idx}_time_profile",
+            key_suffix="time_profile",
             translation_key="zone_time_profile_control",
             name="Zeitprofil",
             zone_idx=zone_idx,
@@ -95,11 +114,28 @@ for zone_idx in range(1, 4):
         )
     )
 
+SELECT_DESCRIPTIONS: tuple[GetAirSelectEntityDescription, ...] = tuple(_descriptions)
+del _descriptions
+
+# Descriptions per zone, so setup only walks the enabled zones
+SELECT_DESCRIPTIONS_BY_ZONE: dict[int, tuple[GetAirSelectEntityDescription, ...]] = {
+    zone_idx: tuple(d for d in SELECT_DESCRIPTIONS if d.zone_idx == zone_idx)
+    for zone_idx in range(1, 4)
+}
 
 
 class GetAirSelect(CoordinatorEntity, SelectEntity):
     """Representation of a getAir select entity."""
 
+    __slots__ = (
+        "_device_id",
+        "_zone_idx",
+        "_data_key",
+        "_zone_name",
+        "_profile_options",
+        "_profile_numbers",
+    )
+
     _attr_has_entity_name = False
     entity_description: GetAirSelectEntityDescription
 
@@ -114,76 +150,91 @@ class GetAirSelect(CoordinatorEntity, SelectEntity):
         self.entity_description = description
         self._device_id = device_id
         self._zone_idx = description.zone_idx
+        self._data_key = description.data_key
         
         # Build entity_id with getair prefix, device_id, and zone name
         zone_name = coordinator.data["zones"][self._zone_idx]["name"]
-        zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-        zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
+        zone_name_clean = coordinator.zone_clean_names[self._zone_idx]
         
-        key_with_zone = description.key.replace("{zone_name}", zone_name_clean)
-        self._attr_unique_id = f"getair_{device_id}_{key_with_zone}"
+        self._attr_unique_id = (
+            f"getair_{device_id}_{self._zone_idx}_{zone_name_clean}_{description.key_suffix}"
+        )
+
+        # Zone name and time profile options only change with
+        # coordinator data, so they are rebuilt there instead of on every read
+        self._zone_name = zone_name
+        self._attr_name = f"{zone_name} {description.name}"
+        self._profile_options: list[str] = ["Kein Profil"]
+        self._profile_numbers: dict[str, int] = {}
+        if description.data_key == "time_profile":
+            self._update_profiles()
 
     @property
-    def name(self) -> str:
-        """Return the name of the select."""
+    def device_info(self) -> DeviceInfo:
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
+
+    def _update_profiles(self) -> None:
+        """
+        Rebuild the time profile options and the name -> number lookup.
+
+        Options are "Kein Profil" plus every named profile; for duplicate
+        names the lowest profile number wins.
+        """
+        system_data = self.coordinator.data.get("system", {})
+        available_profiles = ["Kein Profil"]  # Always include "no profile" option
+        profile_numbers: dict[str, int] = {}
+
+        # Check profiles 1-10 and add those with names
+        for i, key in enumerate(_TIME_PROFILE_KEYS, start=1):
+            profile_name = system_data.get(key, "")
+            if profile_name and profile_name.strip():  # Only if name exists and is not empty
+                available_profiles.append(profile_name)
+                profile_numbers.setdefault(profile_name, i)
+
+        self._profile_options = available_profiles
+        self._profile_numbers = profile_numbers
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached zone name and options, then write state."""
         if self.coordinator.data:
             zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} {self.entity_description.name}"
-        return self.entity_description.name
+            if zone_name != self._zone_name:
+                self._zone_name = zone_name
+                self._attr_name = f"{zone_name} {self.entity_description.name}"
+            if self._data_key == "time_profile":
+                self._update_profiles()
+        super()._handle_coordinator_update()
 
     @property
     def options(self) -> list[str]:
         """Return the list of available options with labels."""
-        data_key = self.entity_description.data_key
+        data_key = self._data_key
         
         # Mode selector
         if data_key == "mode":
-            return [MODE_LABELS[mode] for mode in AVAILABLE_MODES]
+            return MODE_OPTIONS
         
         # Target humidity selector
         elif data_key == "target_hmdty_level":
-            return list(HUMIDITY_LEVEL_LABELS.values())
+            return HUMIDITY_OPTIONS
         
         # Time profile selector - show only profiles that have names
         elif data_key == "time_profile":
-            if not self.coordinator.data:
-                _LOGGER.warning("Time profile options: No coordinator data available")
-                return ["Kein Profil"]  # Fallback
-            
-            system_data = self.coordinator.data.get("system", {})
-            available_profiles = ["Kein Profil"]  # Always include "no profile" option
-            
-            # Check profiles 1-10 and add those with names
-            for i in range(1, 11):
-                profile_name = system_data.get(f"time_profile_{i}_name", "")
-                if profile_name and profile_name.strip():  # Only if name exists and is not empty
-                    available_profiles.append(profile_name)
-            
-            return available_profiles
+            return self._profile_options
         
         return []
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-            name=zone_name,
-            manufacturer=MANUFACTURER,
-            model="SmartControl Zone",
-            via_device=(DOMAIN, self._device_id),
-        )
-
     @property
     def current_option(self) -> str | None:
         """Return the current option (translated to label)."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        zone_data = self.coordinator.data["zones"].get(self._zone_idx, {})
-        data_key = self.entity_description.data_key
-        api_value = zone_data.get(data_key)
+        data_key = self._data_key
+        api_value = data["zones"].get(self._zone_idx, {}).get(data_key)
         
         if api_value is None:
             return None
@@ -208,8 +259,12 @@ class GetAirSelect(CoordinatorEntity, SelectEntity):
                     return "Kein Profil"
                 
                 # Get actual profile name from system data
-                system_data = self.coordinator.data.get("system", {})
-                profile_name = system_data.get(f"time_profile_{profile_num}_name", "")
+                system_data = data.get("system", {})
+                profile_name = (
+                    system_data.get(_TIME_PROFILE_KEYS[profile_num - 1], "")
+                    if 1 <= profile_num <= len(_TIME_PROFILE_KEYS)
+                    else ""
+                )
                 
                 if profile_name and profile_name.strip():
                     return profile_name
@@ -224,22 +279,13 @@ class GetAirSelect(CoordinatorEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Select a new option (convert from label to API value)."""
-        data_key = self.entity_description.data_key
+        data_key = self._data_key
         api_value = None
         
-        # Mode selector - convert label to API value
-        if data_key == "mode":
-            for mode, label in MODE_LABELS.items():
-                if label == option:
-                    api_value = mode
-                    break
-        
-        # Target humidity selector
-        elif data_key == "target_hmdty_level":
-            for value, label in HUMIDITY_LEVEL_LABELS.items():
-                if label == option:
-                    api_value = value
-                    break
+        # Mode and target humidity selectors - one dict lookup each
+        lookup = _OPTION_LOOKUPS.get(data_key)
+        if lookup is not None:
+            api_value = lookup.get(option)
         
         # Time profile selector - convert name back to profile number
         elif data_key == "time_profile":
@@ -248,19 +294,15 @@ class GetAirSelect(CoordinatorEntity, SelectEntity):
                 api_value = 0
             else:
                 # Find profile number by name
-                system_data = self.coordinator.data.get("system", {})
-                for i in range(1, 11):
-                    profile_name = system_data.get(f"time_profile_{i}_name", "")
-                    if profile_name == option:
-                        api_value = i
-                        break
+                api_value = self._profile_numbers.get(option)
         
         if api_value is None:
             _LOGGER.error("Unknown option: %s for %s", option, data_key)
             return
         
-        _LOGGER.debug("Setting zone %s %s to %s (type: %s) (%s)", 
-                     self._zone_idx, data_key, api_value, type(api_value).__name__, option)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Setting zone %s %s to %s (type: %s) (%s)", 
+                         self._zone_idx, data_key, api_value, type(api_value).__name__, option)
         
         # Use the appropriate coordinator method
         if data_key == "mode":
@@ -279,9 +321,9 @@ class GetAirSelect(CoordinatorEntity, SelectEntity):
                 api_value,
             )
         
-        if success:
-            await self.coordinator.async_request_refresh()
-        else:
+        # On success the coordinator has already applied the value to its
+        # data and scheduled the reconciling refresh itself
+        if not success:
             _LOGGER.error("Failed to set zone %s %s to %s", self._zone_idx, data_key, api_value)
 
 
@@ -293,17 +335,13 @@ async def async_setup_entry(
     """Set up select entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
-
-    entities = []
-
-    for description in SELECT_DESCRIPTIONS:
-        # Skip zone selectors if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
-        entity = GetAirSelect(coordinator, device_id, description)
-        entities.append(entity)
+    entities = [
+        GetAirSelect(coordinator, device_id, description)
+        for zone_idx in sorted(enabled_idx)
+        for description in SELECT_DESCRIPTIONS_BY_ZONE[zone_idx]
+    ]
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
@@ -1,7 +1,8 @@
 """Sensor entities for getAir SmartControl."""
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, tzinfo
+from functools import lru_cache
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -11,16 +12,22 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, PERCENTAGE, UnitOfPressure, UnitOfTime
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+import homeassistant.util.dt as dt_util
 
 from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# German month names, indexed by month number (index 0 unused)
+GERMAN_MONTHS = (
+    "", "Januar", "Februar", "März", "April", "Mai", "Juni",
+    "Juli", "August", "September", "Oktober", "November", "Dezember",
+)
+
 
 def format_datetime(iso_string: str) -> str:
     """Convert ISO datetime string to readable German format.
@@ -30,26 +37,44 @@ def format_datetime(iso_string: str) -> str:
     if not iso_string:
         return None
 
+    return _format_datetime_cached(iso_string)
+
+
+# boot_time/notify_time rarely change and last_update only once per poll, so
+# the same ISO strings are formatted over and over on state reads; caching is
+# intentional (a malformed string is logged once, then served from the cache)
+@lru_cache(maxsize=256)
+def _format_datetime_cached(iso_string: str) -> str:
+    """Format a non-empty ISO datetime string (see format_datetime)."""
+    # The API sends a fixed "YYYY-MM-DDTHH:MM:SS..." shape, so take the fields
+    # straight out of the string (same local time fromisoformat would give)
+    if (
+        len(iso_string) >= 19
+        and iso_string[4] == "-"
+        and iso_string[7] == "-"
+        and iso_string[10] in "T "
+        and iso_string[13] == ":"
+        and iso_string[16] == ":"
+    ):
+        try:
+            month = int(iso_string[5:7])
+        except ValueError:
+            month = 0
+        if 1 <= month <= 12:
+            return f"{iso_string[8:10]}. {GERMAN_MONTHS[month]} {iso_string[0:4]} um {iso_string[11:19]}"
+
+    # Anything else goes through the full ISO parser
     try:
-        # Parse ISO format
         dt = datetime.fromisoformat(iso_string)
 
-        # German month names
-        german_months = {
-            1: "Januar", 2: "Februar", 3: "März", 4: "April",
-            5: "Mai", 6: "Juni", 7: "Juli", 8: "August",
-            9: "September", 10: "Oktober", 11: "November", 12: "Dezember"
-        }
-
         # Format: "29. Januar 2026 um 07:28:37"
-        month_name = german_months.get(dt.month, "")
-        return dt.strftime(f"%d. {month_name} %Y um %H:%M:%S")
+        return dt.strftime(f"%d. {GERMAN_MONTHS[dt.month]} %Y um %H:%M:%S")
     except Exception as e:
         _LOGGER.warning("Could not format datetime %s: %s", iso_string, e)
         return iso_string
 
 
-@dataclass
+@dataclass(frozen=True)
 class GetAirSensorEntityDescription(SensorEntityDescription):
     """Describe getAir sensor entity."""
 
@@ -57,7 +82,7 @@ class GetAirSensorEntityDescription(SensorEntityDescription):
     data_key: str | None = None
 
 
-SENSOR_DESCRIPTIONS = [
+_descriptions: list[GetAirSensorEntityDescription] = [
     # System-wide sensors with descriptive keys
     GetAirSensorEntityDescription(
         key="system_air_quality_iaq",
@@ -193,34 +218,107 @@ SENSOR_DESCRIPTIONS = [
     ),
 ]
 
+# Zone-specific sensors:
+# (data_key, key_suffix, translation_key, name_de, icon, unit, device_class, state_class)
+_ZONE_SENSOR_SPECS = (
+    ("temperature", "temperature_celsius", "zone_temperature", "Temperatur (innen)", "mdi:thermometer", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
+    ("humidity", "humidity_percent", "zone_humidity", "Luftfeuchtigkeit (innen)", "mdi:water-percent", PERCENTAGE, SensorDeviceClass.HUMIDITY, SensorStateClass.MEASUREMENT),
+    ("outdoor_temp", "outdoor_temperature_celsius", "zone_outdoor_temperature", "Temperatur (außen)", "mdi:thermometer-lines", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
+    ("outdoor_humidity", "outdoor_humidity_percent", "zone_outdoor_humidity", "Luftfeuchtigkeit (außen)", "mdi:water-outline", PERCENTAGE, SensorDeviceClass.HUMIDITY, SensorStateClass.MEASUREMENT),
+    ("runtime", "runtime_hours", "zone_runtime", "Laufzeit", "mdi:timer-sand", UnitOfTime.HOURS, None, SensorStateClass.TOTAL),
+    ("last_filter_change", "filter_runtime_hours", "zone_filter_runtime", "Filter-Laufzeit", "mdi:air-filter", UnitOfTime.HOURS, None, SensorStateClass.TOTAL),
+    ("target_temp", "target_temperature_celsius", "zone_target_temperature", "Zieltemperatur", "mdi:thermometer-auto", UnitOfTemperature.CELSIUS, None, SensorStateClass.MEASUREMENT),
+    ("target_hmdty_level", "target_humidity_level", "zone_target_humidity", "Ziel-Luftfeuchtigkeitsbereich", "mdi:water-percent-alert", None, None, None),
+    ("time_profile", "time_profile_id", "zone_time_profile", "Aktives Zeitprofil", "mdi:clock-time-eight-outline", None, None, None),
+    ("mode_deadline_datetime", "mode_deadline_readable", "zone_mode_deadline_datetime", "Modus-Deadline", "mdi:calendar-clock", None, SensorDeviceClass.TIMESTAMP, None),
+    ("mode_deadline_duration", "mode_deadline_remaining_minutes", "zone_mode_deadline_remaining", "Modus-Deadline (verbleibend)", "mdi:timer-sand", "min", None, SensorStateClass.MEASUREMENT),
+)
+
 # Add zone-specific sensors with descriptive keys
-for zone_idx in range(1, 4):
-    for data_key, key_suffix, translation_key, name_de, icon, unit, device_class, state_class in [
-        ("temperature", "temperature_celsius", "zone_temperature", "Temperatur (innen)", "mdi:thermometer", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-        ("humidity", "humidity_percent", "zone_humidity", "Luftfeuchtigkeit (innen)", "mdi:water-percent", PERCENTAGE, SensorDeviceClass.HUMIDITY, SensorStateClass.MEASUREMENT),
-        ("outdoor_temp", "outdoor_temperature_celsius", "zone_outdoor_temperature", "Temperatur (außen)", "mdi:thermometer-lines", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-        ("outdoor_humidity", "outdoor_humidity_percent", "zone_outdoor_humidity", "Luftfeuchtigkeit (außen)", "mdi:water-outline", PERCENTAGE, SensorDeviceClass.HUMIDITY, SensorStateClass.MEASUREMENT),
-        ("runtime", "runtime_hours", "zone_runtime", "Laufzeit", "mdi:timer-sand", UnitOfTime.HOURS, None, SensorStateClass.TOTAL),
-        ("last_filter_change", "filter_runtime_hours", "zone_filter_runtime", "Filter-Laufzeit", "mdi:air-filter", UnitOfTime.HOURS, None, SensorStateClass.TOTAL),
-        ("target_temp", "target_temperature_celsius", "zone_target_temperature", "Zieltemperatur", "mdi:thermometer-auto", UnitOfTemperature.CELSIUS, None, SensorStateClass.MEASUREMENT),
-        ("target_hmdty_level", "target_humidity_level", "zone_target_humidity", "Ziel-Luftfeuchtigkeitsbereich", "mdi:water-percent-alert", None, None, None),
-        ("time_profile", "time_profile_id", "zone_time_profile", "Aktives Zeitprofil", "mdi:clock-time-eight-outline", None, None, None),
-        ("mode_deadline_datetime", "mode_deadline_readable", "zone_mode_deadline_datetime", "Modus-Deadline", "mdi:calendar-clock", None, SensorDeviceClass.TIMESTAMP, None),
-        ("mode_deadline_duration", "mode_deadline_remaining_minutes", "zone_mode_deadline_remaining", "Modus-Deadline (verbleibend)", "mdi:timer-sand", "min", None, SensorStateClass.MEASUREMENT),
-    ]:
-        SENSOR_DESCRIPTIONS.append(
-            GetAirSensorEntityDescription(
-                key=f"zone_{zone_idx}_{key_suffix}",
-                translation_key=translation_key,
-                name=name_de,
-                icon=icon,
-                data_key=data_key,
-                native_unit_of_measurement=unit,
-                state_class=state_class,
-                device_class=device_class,
-                zone_idx=zone_idx,
-            )
-        )
+_descriptions += [
+    GetAirSensorEntityDescription(
+        key=f"zone_{zone_idx}_{key_suffix}",
+        translation_key=translation_key,
+        name=name_de,
+        icon=icon,
+        data_key=data_key,
+        native_unit_of_measurement=unit,
+        state_class=state_class,
+        device_class=device_class,
+        zone_idx=zone_idx,
+    )
+    for zone_idx in range(1, 4)
+    for data_key, key_suffix, translation_key, name_de, icon, unit, device_class, state_class in _ZONE_SENSOR_SPECS
+]
+
+SENSOR_DESCRIPTIONS: tuple[GetAirSensorEntityDescription, ...] = tuple(_descriptions)
+del _descriptions
+
+# System descriptions and descriptions per zone, so setup only walks the
+# enabled zones
+SYSTEM_SENSOR_DESCRIPTIONS: tuple[GetAirSensorEntityDescription, ...] = tuple(
+    d for d in SENSOR_DESCRIPTIONS if d.zone_idx is None
+)
+SENSOR_DESCRIPTIONS_BY_ZONE: dict[int, tuple[GetAirSensorEntityDescription, ...]] = {
+    zone_idx: tuple(d for d in SENSOR_DESCRIPTIONS if d.zone_idx == zone_idx)
+    for zone_idx in range(1, 4)
+}
+
+
+@lru_cache(maxsize=64)
+def _ts_to_datetime(ts: int, tz: tzinfo) -> datetime:
+    """Convert a Unix timestamp to an aware datetime (deadlines rarely change)."""
+    return datetime.fromtimestamp(ts, tz=tz)
+
+
+def _mode_deadline_datetime(value, zone_data: dict, now_unix: int) -> datetime | None:
+    """Convert the zone's Unix deadline to a datetime for the TIMESTAMP sensor."""
+    deadline_unix = zone_data.get("mode_deadline")
+    if deadline_unix and deadline_unix > 0:
+        try:
+            if type(deadline_unix) is not int:
+                deadline_unix = int(deadline_unix)
+            # Use Home Assistant's timezone utility to get the configured
+            # timezone (read on each call, it can change at runtime)
+            return _ts_to_datetime(deadline_unix, dt_util.DEFAULT_TIME_ZONE)
+        except (ValueError, TypeError, OSError):
+            return None
+    return None
+
+
+def _mode_deadline_duration(value, zone_data: dict, now_unix: int) -> int:
+    """Calculate the minutes remaining until the zone's deadline."""
+    deadline_unix = zone_data.get("mode_deadline")
+    if deadline_unix and deadline_unix > 0:
+        try:
+            remaining_seconds = int(deadline_unix) - now_unix
+            return max(0, remaining_seconds // 60)
+        except (ValueError, TypeError):
+            return 0
+    return 0
+
+
+def _formatted_datetime(value, data: dict, now_unix: int) -> str | None:
+    """Format ISO datetime strings, pass anything else through."""
+    if isinstance(value, str):
+        return format_datetime(value)
+    return value
+
+
+def _notification(value, data: dict, now_unix: int) -> str:
+    """Show "Keine" for an empty notification."""
+    return value or "Keine"
+
+
+# data_key -> special value handler; all other keys return the raw value
+_VALUE_HANDLERS = {
+    "mode_deadline_datetime": _mode_deadline_datetime,
+    "mode_deadline_duration": _mode_deadline_duration,
+    "boot_time": _formatted_datetime,
+    "last_update": _formatted_datetime,
+    "notify_time": _formatted_datetime,
+    "notification": _notification,
+}
 
 
 class GetAirSensor(CoordinatorEntity, SensorEntity):
@@ -240,107 +338,87 @@ class GetAirSensor(CoordinatorEntity, SensorEntity):
         self.entity_description = description
         self._device_id = device_id
         self._zone_idx = description.zone_idx
+        self._data_key = description.data_key
+        self._value_handler = _VALUE_HANDLERS.get(description.data_key)
 
         # Build clean entity_id
         if self._zone_idx:
-            zone_name = coordinator.data["zones"][self._zone_idx]["name"]
-            zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-            zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
+            zone_name_clean = coordinator.zone_clean_names[self._zone_idx]
             self._attr_unique_id = f"getair_{device_id}_zone_{self._zone_idx}_{zone_name_clean}_{description.key}"
         else:
             self._attr_unique_id = f"getair_{device_id}_{description.key}"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        # Get translated name from entity description
-        if hasattr(self.entity_description, 'name') and self.entity_description.name:
-            base_name = self.entity_description.name
+        # Name and DeviceInfo are plain _attr_* values, rebuilt by
+        # _handle_coordinator_update only when their source data changes
+        if description.name:
+            self._base_name = description.name
         else:
             # Fallback: use key as name
-            base_name = self.entity_description.key.replace("_", " ").title()
-        
-        # For zone sensors, prepend zone name
-        if self._zone_idx and self.coordinator.data:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} {base_name}"
-        
-        return base_name
+            self._base_name = description.key.replace("_", " ").title()
+        self._zone_name = None
+        self._set_device_attrs()
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
+        # Formatted/converted once per coordinator update instead of per read
+        self._value = self._compute_value()
+
+    def _set_device_attrs(self) -> None:
+        """Set name and DeviceInfo from the current zone/system data."""
+        # DeviceInfo is shared by all entities of the device
+        self._attr_device_info = self.coordinator.device_info(self._zone_idx)
         if self._zone_idx:
             zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-                name=zone_name,
-                manufacturer=MANUFACTURER,
-                model="SmartControl Zone",
-                via_device=(DOMAIN, self._device_id),
-            )
+            if zone_name != self._zone_name:
+                self._zone_name = zone_name
+                # For zone sensors, prepend zone name
+                self._attr_name = f"{zone_name} {self._base_name}"
         else:
-            system_data = self.coordinator.data["system"]
-            return DeviceInfo(
-                identifiers={(DOMAIN, self._device_id)},
-                name=f"getAir {system_data.get('system_type', 'SmartControl')}",
-                manufacturer=MANUFACTURER,
-                model=system_data.get("system_type", "SmartControl"),
-                sw_version=system_data.get("fw_version", "Unknown"),
-            )
+            self._attr_name = self._base_name
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up a renamed zone or new system info, then write the new state."""
+        if self.coordinator.data:
+            self._set_device_attrs()
+        self._value = self._compute_value()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> float | str | None:
         """Return the sensor value."""
-        if not self.coordinator.data:
+        return self._value
+
+    def _compute_value(self) -> float | str | None:
+        """Read (and format, where needed) this sensor's value from the coordinator."""
+        coordinator = self.coordinator
+        data = coordinator.data
+        if not data:
             return None
 
-        if self._zone_idx:
-            zone_data = self.coordinator.data["zones"].get(self._zone_idx, {})
-            value = zone_data.get(self.entity_description.data_key)
+        zone_idx = self._zone_idx
+        if zone_idx:
+            source = data["zones"].get(zone_idx, {})
         else:
-            system_data = self.coordinator.data["system"]
-            value = system_data.get(self.entity_description.data_key)
-
-        # Special handling for mode_deadline sensors
-        if self._zone_idx and self.entity_description.data_key == "mode_deadline_datetime":
-            # Convert Unix timestamp to datetime object for TIMESTAMP sensor
-            deadline_unix = zone_data.get("mode_deadline")
-            if deadline_unix and deadline_unix > 0:
-                try:
-                    from datetime import datetime
-                    import homeassistant.util.dt as dt_util
-                    # Use Home Assistant's timezone utility to get the configured timezone
-                    dt = datetime.fromtimestamp(int(deadline_unix), tz=dt_util.DEFAULT_TIME_ZONE)
-                    return dt  # Return datetime object with correct timezone
-                except (ValueError, TypeError, OSError):
-                    return None
-            return None
-        
-        if self._zone_idx and self.entity_description.data_key == "mode_deadline_duration":
-            # Calculate remaining minutes
-            deadline_unix = zone_data.get("mode_deadline")
-            if deadline_unix and deadline_unix > 0:
-                try:
-                    import time
-                    current_unix = int(time.time())
-                    remaining_seconds = int(deadline_unix) - current_unix
-                    remaining_minutes = max(0, remaining_seconds // 60)
-                    return remaining_minutes
-                except (ValueError, TypeError):
-                    return 0
-            return 0
+            source = data["system"]
+        value = source.get(self._data_key)
 
-        # Format datetime strings (boot_time, last_update, notify_time)
-        if self.entity_description.data_key in ("boot_time", "last_update", "notify_time") and isinstance(value, str):
-            return format_datetime(value)
+        # Special handling (deadlines, datetime strings, notification)
+        handler = self._value_handler
+        if handler is not None:
+            return handler(value, source, coordinator.now_unix)
+        return value
 
 
-        # Show "Keine" for empty notification
-        if self.entity_description.data_key == "notification" and not value:
-            return "Keine"
+# (profile number, system data key) of the names of time profiles 1-10
+_PROFILE_SPECS = tuple((i, f"time_profile_{i}_name") for i in range(1, 11))
 
-        return value
+
+def _has_profile_name(system_data: dict, i: int, profile_name_key: str) -> bool:
+    """Return True (and log it) if time profile i has a non-empty name."""
+    profile_name = system_data.get(profile_name_key)
+    if isinstance(profile_name, str) and profile_name.strip():
+        _LOGGER.info("Adding sensor for time profile %d: %s", i, profile_name)
+        return True
+    return False
 
 
 async def async_setup_entry(
@@ -351,40 +429,42 @@ async def async_setup_entry(
     """Set up sensor entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
-
-    entities = []
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
     # Dynamically add sensors for non-empty time-profile names
-    extra_descriptions: list[GetAirSensorEntityDescription] = []
     try:
         system_data = coordinator.data.get("system", {}) if coordinator.data else {}
-        for i in range(1, 11):
-            profile_name_key = f"time_profile_{i}_name"
-            profile_name = system_data.get(profile_name_key)
-            if profile_name and profile_name.strip():  # Only if name exists and is not empty
-                _LOGGER.info("Adding sensor for time profile %d: %s", i, profile_name)
-                extra_descriptions.append(
-                    GetAirSensorEntityDescription(
-                        key=f"time_profile_{i}_name",
-                        translation_key=f"time_profile_{i}_name",
-                        name=f"Zeitprofil {i} Name",
-                        icon="mdi:calendar-clock",
-                        data_key=profile_name_key,
-                        zone_idx=None,
-                    )
-                )
     except Exception as e:
         _LOGGER.warning("Error creating dynamic time profile sensors: %s", e)
-        extra_descriptions = []
-
-    for description in SENSOR_DESCRIPTIONS + extra_descriptions:
-        # Skip zone sensors if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
-
-        entity = GetAirSensor(coordinator, device_id, description)
-        entities.append(entity)
-
-    async_add_entities(entities)
+        system_data = {}
+
+    extra_descriptions = [
+        GetAirSensorEntityDescription(
+            key=profile_name_key,
+            translation_key=profile_name_key,
+            name=f"Zeitprofil {i} Name",
+            icon="mdi:calendar-clock",
+            data_key=profile_name_key,
+            zone_idx=None,
+        )
+        for i, profile_name_key in _PROFILE_SPECS
+        # Only if name exists and is not empty
+        if _has_profile_name(system_data, i, profile_name_key)
+    ]
+
+    entities = [
+        GetAirSensor(coordinator, device_id, description)
+        for description in SYSTEM_SENSOR_DESCRIPTIONS
+    ]
+    entities += [
+        GetAirSensor(coordinator, device_id, description)
+        for zone_idx in sorted(enabled_idx)
+        for description in SENSOR_DESCRIPTIONS_BY_ZONE[zone_idx]
+    ]
+    entities += [
+        GetAirSensor(coordinator, device_id, description)
+        for description in extra_descriptions
+    ]
+
+    if entities:
+        async_add_entities(entities)
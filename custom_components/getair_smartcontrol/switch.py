@@ -1,49 +1,66 @@
 """Switch entities for getAir SmartControl."""
 import logging
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default for missing zone data
+_EMPTY: dict[str, Any] = {}
 
-@dataclass
+
+@dataclass(frozen=True)
 class GetAirSwitchEntityDescription(SwitchEntityDescription):
     """Describe getAir switch entity."""
 
     zone_idx: int | None = None
     data_key: str | None = None
+    key_suffix: str = ""
 
 
-SWITCH_DESCRIPTIONS = []
+# Zone-specific switches: (data_key, key_suffix, translation_key, name_de, icon)
+_ZONE_SWITCH_SPECS = (
+    ("auto_mode_voc", "voc", "zone_auto_mode_voc_switch", "VOC Auto-Modus", "mdi:air-filter"),
+    ("auto_mode_silent", "silent", "zone_auto_mode_silent_switch", "Silent-Modus", "mdi:weather-night"),
+)
 
 # Add zone-specific switches
-for zone_idx in range(1, 4):
-    for data_key, key_suffix, translation_key, name_de in [
-        ("auto_mode_voc", "voc", "zone_auto_mode_voc_switch", "VOC Auto-Modus"),
-        ("auto_mode_silent", "silent", "zone_auto_mode_silent_switch", "Silent-Modus"),
-    ]:
-        SWITCH_DESCRIPTIONS.append(
-            GetAirSwitchEntityDescription(
-                key=f"{zone_idx}_{{zone_name}}_{key_suffix}",  # Placeholder for zone name
-                translation_key=translation_key,
-                name=name_de,
-                data_key=data_key,
-                zone_idx=zone_idx,
-            )
-        )
+SWITCH_DESCRIPTIONS: tuple[GetAirSwitchEntityDescription, ...] = tuple(
+    GetAirSwitchEntityDescription(
+        key=f"zone_{zone_idx}_{key_suffix}",
+        key_suffix=key_suffix,
+        translation_key=translation_key,
+        name=name_de,
+        icon=icon,
+        data_key=data_key,
+        zone_idx=zone_idx,
+    )
+    for zone_idx in range(1, 4)
+    for data_key, key_suffix, translation_key, name_de, icon in _ZONE_SWITCH_SPECS
+)
+
+# Descriptions per zone, so setup only walks the enabled zones
+SWITCH_DESCRIPTIONS_BY_ZONE: dict[int, tuple[GetAirSwitchEntityDescription, ...]] = {
+    zone_idx: tuple(d for d in SWITCH_DESCRIPTIONS if d.zone_idx == zone_idx)
+    for zone_idx in range(1, 4)
+}
+
 
 class GetAirSwitch(CoordinatorEntity, SwitchEntity):
     """Representation of a getAir switch."""
 
+    __slots__ = ("_device_id", "_zone_idx", "_zone_name", "_last_written")
+
     _attr_has_entity_name = False
     entity_description: GetAirSwitchEntityDescription
 
@@ -59,125 +76,113 @@ class GetAirSwitch(CoordinatorEntity, SwitchEntity):
         self._device_id = device_id
         self._zone_idx = description.zone_idx
 
-        # Set icon based on data_key
-        if description.data_key == "auto_mode_voc":
-            self._attr_icon = "mdi:air-filter"
-        elif description.data_key == "auto_mode_silent":
-            self._attr_icon = "mdi:weather-night"
-        elif description.data_key == "auto_update_enabled":
-            self._attr_icon = "mdi:update"
+        # (available, value) of the last coordinator-driven write
+        self._last_written: tuple | None = None
+
+        # The name is a plain _attr_* value, rebuilt by
+        # _handle_coordinator_update only when the zone is renamed
+        if self._zone_idx:
+            self._zone_name: str | None = coordinator.data["zones"][self._zone_idx]["name"]
+            self._attr_name = f"{self._zone_name} {description.name}"
+        else:
+            self._zone_name = None
+            self._attr_name = description.name
 
         # Build entity_id with getair prefix, device_id, and zone name
         if self._zone_idx:
-            # Get zone name from coordinator and sanitize it for entity_id
-            zone_name = coordinator.data["zones"][self._zone_idx]["name"]
-            # Sanitize zone name: lowercase, replace spaces/special chars with underscore
-            zone_name_clean = zone_name.lower().replace(" ", "_").replace("-", "_")
-            zone_name_clean = "".join(c if c.isalnum() or c == "_" else "_" for c in zone_name_clean)
-            
-            # Replace placeholder in key with actual zone name
-            key_with_zone = description.key.replace("{zone_name}", zone_name_clean)
+            # Zone name sanitized once per zone by the coordinator
+            zone_name_clean = coordinator.zone_clean_names[self._zone_idx]
             
             # Entity ID pattern: getair_<device_id>_<zone_idx>_<zone_name>_<suffix>
-            self._attr_unique_id = f"getair_{device_id}_{key_with_zone}"
+            self._attr_unique_id = (
+                f"getair_{device_id}_{self._zone_idx}_{zone_name_clean}_{description.key_suffix}"
+            )
         else:
             # System-level switch: getair_<device_id>_<key>
             self._attr_unique_id = f"getair_{device_id}_{description.key}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability, value or zone name changed."""
+        zone = self._zone if self._zone_idx else None
+        renamed = zone is not None and zone["name"] != self._zone_name
+        if renamed:
+            self._zone_name = zone["name"]
+            self._attr_name = f"{self._zone_name} {self.entity_description.name}"
+
+        snapshot = (self.available, self.is_on)
+        if not renamed and snapshot == self._last_written:
+            return
+        self._last_written = snapshot
+        super()._handle_coordinator_update()
+
     @property
-    def name(self) -> str:
-        """Return the name of the switch."""
-        if self._zone_idx and self.coordinator.data:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return f"{zone_name} {self.entity_description.name}"
-        return self.entity_description.name
+    def _zone(self) -> dict[str, Any] | None:
+        """Return this zone's coordinator data, or None before the first refresh."""
+        data = self.coordinator.data
+        return data["zones"].get(self._zone_idx) if data else None
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        if self._zone_idx:
-            zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-                name=zone_name,
-                manufacturer=MANUFACTURER,
-                model="SmartControl Zone",
-                via_device=(DOMAIN, self._device_id),
-            )
-        else:
-            # System device with full hardware info
-            system_data = self.coordinator.data["system"]
-            return DeviceInfo(
-                identifiers={(DOMAIN, self._device_id)},
-                name=f"getAir {system_data.get('system_type', 'SmartControl')}",
-                manufacturer=MANUFACTURER,
-                model=system_data.get("system_type", "SmartControl"),
-                sw_version=system_data.get("fw_version", "Unknown"),
-                serial_number=system_data.get("system_id", self._device_id),
-            )
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
 
     @property
     def is_on(self) -> bool | None:
         """Return the switch state."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
+        data_key = self.entity_description.data_key
         if self._zone_idx:
-            zone_data = self.coordinator.data["zones"].get(self._zone_idx, {})
-            return zone_data.get(self.entity_description.data_key)
-        else:
-            system_data = self.coordinator.data["system"]
-            return system_data.get(self.entity_description.data_key)
+            return data["zones"].get(self._zone_idx, _EMPTY).get(data_key)
+        return data["system"].get(data_key)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
-        _LOGGER.debug(
-            "Turning on %s for %s",
-            self.entity_description.data_key,
-            f"zone {self._zone_idx}" if self._zone_idx else "system",
-        )
-
-        if self._zone_idx:
-            success = await self.coordinator.async_set_zone_property(
-                self._zone_idx,
-                self.entity_description.data_key,
-                True,
-            )
-        else:
-            success = await self.coordinator.async_set_system_property(
-                self.entity_description.data_key,
-                True,
-            )
-
-        if success:
-            await self.coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to turn on switch")
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the switch off."""
+        await self._async_set(False)
+
+    async def _async_set(self, value: bool) -> None:
+        """
+        Write the switch state to the zone or system.
+
+        :param value: True to turn on, False to turn off
+        """
+        state = "on" if value else "off"
+        data_key = self.entity_description.data_key
+
+        if self.is_on is value:
+            _LOGGER.debug("%s is already %s, skipping", data_key, state)
+            return
+
         _LOGGER.debug(
-            "Turning off %s for %s",
-            self.entity_description.data_key,
+            "Turning %s %s for %s",
+            state,
+            data_key,
             f"zone {self._zone_idx}" if self._zone_idx else "system",
         )
 
         if self._zone_idx:
             success = await self.coordinator.async_set_zone_property(
                 self._zone_idx,
-                self.entity_description.data_key,
-                False,
+                data_key,
+                value,
             )
         else:
             success = await self.coordinator.async_set_system_property(
-                self.entity_description.data_key,
-                False,
+                data_key,
+                value,
             )
 
-        if success:
-            await self.coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to turn off switch")
+        # On success the coordinator has already applied the value to its
+        # data and scheduled the reconciling refresh itself
+        if not success:
+            _LOGGER.error("Failed to turn %s switch", state)
 
 
 async def async_setup_entry(
@@ -188,17 +193,13 @@ async def async_setup_entry(
     """Set up switch entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
-
-    entities = []
-
-    for description in SWITCH_DESCRIPTIONS:
-        # Skip zone switches if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
-        entity = GetAirSwitch(coordinator, device_id, description)
-        entities.append(entity)
+    entities = [
+        GetAirSwitch(coordinator, device_id, description)
+        for zone_idx in sorted(enabled_idx)
+        for description in SWITCH_DESCRIPTIONS_BY_ZONE[zone_idx]
+    ]
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
@@ -1,21 +1,25 @@
 """Text entities for getAir SmartControl."""
 import logging
 from dataclasses import dataclass
+from typing import Any
 
 from homeassistant.components.text import TextEntity, TextEntityDescription, TextMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import GetAirCoordinator
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default for missing zone data
+_EMPTY: dict[str, Any] = {}
 
-@dataclass
+
+@dataclass(frozen=True)
 class GetAirTextEntityDescription(TextEntityDescription):
     """Describe getAir text entity."""
 
@@ -23,24 +27,30 @@ class GetAirTextEntityDescription(TextEntityDescription):
     data_key: str | None = None
 
 
-TEXT_DESCRIPTIONS = []
-
 # Add zone name text entities
-for zone_idx in range(1, 4):
-    TEXT_DESCRIPTIONS.append(
-        GetAirTextEntityDescription(
-            key=f"zone_{zone_idx}_name",
-            translation_key="zone_name",
-            data_key="name",
-            mode=TextMode.TEXT,
-            zone_idx=zone_idx,
-        )
+TEXT_DESCRIPTIONS: tuple[GetAirTextEntityDescription, ...] = tuple(
+    GetAirTextEntityDescription(
+        key=f"zone_{zone_idx}_name",
+        translation_key="zone_name",
+        data_key="name",
+        mode=TextMode.TEXT,
+        zone_idx=zone_idx,
     )
+    for zone_idx in range(1, 4)
+)
+
+# Descriptions per zone, so setup only walks the enabled zones
+TEXT_DESCRIPTIONS_BY_ZONE: dict[int, tuple[GetAirTextEntityDescription, ...]] = {
+    zone_idx: tuple(d for d in TEXT_DESCRIPTIONS if d.zone_idx == zone_idx)
+    for zone_idx in range(1, 4)
+}
 
 
 class GetAirText(CoordinatorEntity, TextEntity):
     """Representation of a getAir text entity."""
 
+    __slots__ = ("_device_id", "_zone_idx", "_last_written")
+
     _attr_has_entity_name = True
     _attr_native_max = 50  # Maximum length for zone name
     _attr_native_min = 1   # Minimum length
@@ -57,31 +67,40 @@ class GetAirText(CoordinatorEntity, TextEntity):
         self.entity_description = description
         self._device_id = device_id
         self._zone_idx = description.zone_idx
+
+        # (available, zone name) of the last coordinator-driven write
+        self._last_written: tuple | None = None
         self._attr_unique_id = f"{device_id}_zone_{self._zone_idx}_{description.key}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or the zone name (the value) changed."""
+        snapshot = (self.available, self.native_value)
+        if snapshot == self._last_written:
+            return
+        self._last_written = snapshot
+        super()._handle_coordinator_update()
+
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        zone_name = self.coordinator.data["zones"][self._zone_idx]["name"]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._device_id}_zone_{self._zone_idx}")},
-            name=zone_name,
-            manufacturer=MANUFACTURER,
-            model="SmartControl Zone",
-            via_device=(DOMAIN, self._device_id),
-        )
+        """Return device information (shared, cached by the coordinator)."""
+        return self.coordinator.device_info(self._zone_idx)
 
     @property
     def native_value(self) -> str | None:
         """Return the current zone name."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        zone_data = self.coordinator.data["zones"].get(self._zone_idx, {})
-        return zone_data.get(self.entity_description.data_key)
+        return data["zones"].get(self._zone_idx, _EMPTY).get(self.entity_description.data_key)
 
     async def async_set_value(self, value: str) -> None:
         """Set the zone name."""
+        if value == self.native_value:
+            _LOGGER.debug("Zone %s name is already %s, skipping", self._zone_idx, value)
+            return
+
         _LOGGER.debug(
             "Setting zone %s name to: %s",
             self._zone_idx,
@@ -94,9 +113,9 @@ class GetAirText(CoordinatorEntity, TextEntity):
             value,
         )
         
-        if success:
-            await self.coordinator.async_request_refresh()
-        else:
+        # On success the coordinator has already applied the value to its
+        # data and scheduled the reconciling refresh itself
+        if not success:
             _LOGGER.error(
                 "Failed to set zone %s name",
                 self._zone_idx,
@@ -111,17 +130,13 @@ async def async_setup_entry(
     """Set up text entities."""
     coordinator: GetAirCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     device_id: str = hass.data[DOMAIN][config_entry.entry_id]["device_id"]
-    enabled_zones: dict = hass.data[DOMAIN][config_entry.entry_id]["enabled_zones"]
-
-    entities = []
-
-    for description in TEXT_DESCRIPTIONS:
-        # Skip zone text entities if zone is not enabled
-        if description.zone_idx is not None:
-            if not enabled_zones.get(f"zone_{description.zone_idx}", True):
-                continue
+    enabled_idx: frozenset[int] = hass.data[DOMAIN][config_entry.entry_id]["enabled_zone_idx"]
 
-        entity = GetAirText(coordinator, device_id, description)
-        entities.append(entity)
+    entities = [
+        GetAirText(coordinator, device_id, description)
+        for zone_idx in sorted(enabled_idx)
+        for description in TEXT_DESCRIPTIONS_BY_ZONE[zone_idx]
+    ]
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)